@@ -0,0 +1 @@
+"""Load/benchmark suite driving the ASGI app in-process against a local database (`python -m benchmarks`)."""
@@ -0,0 +1,71 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+from .catapi_stub import STUB_BASE_URL
+from .database import ROOT, prepare_database
+
+DEFAULT_DATABASE_URL = f"sqlite+aiosqlite:///{ROOT / '.cache' / 'bench.sqlite3'}"
+DEFAULT_WORKLOADS = "create,assign,update-target,list"
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Seed a local database and benchmark the API in-process.")
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL),
+        help="database to benchmark against; it is wiped and re-migrated unless --no-reset (env BENCH_DATABASE_URL)",
+    )
+    parser.add_argument("--cats", type=int, default=2000, help="cats to seed")
+    parser.add_argument("--missions", type=int, default=4000, help="missions to seed, each with 1-3 targets")
+    parser.add_argument("--requests", type=int, default=500, help="requests per workload")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients per workload")
+    parser.add_argument("--workloads", default=DEFAULT_WORKLOADS, help=f"comma-separated subset of {DEFAULT_WORKLOADS}")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for data and request mix")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="earlier JSON report to compare p95 latency and throughput against")
+    parser.add_argument("--no-reset", action="store_true", help="keep existing data and only apply pending migrations")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    workloads = [name.strip() for name in args.workloads.split(",") if name.strip()]
+
+    # Settings are read when the app is imported, so configure the environment first.
+    os.environ.update(
+        {
+            "DATABASE_URL": args.database_url,
+            "DATABASE_READ_URLS": "",
+            "CAT_API_BASE_URL": STUB_BASE_URL,
+            "BREED_CACHE_BACKEND": "memory",
+            "DB_POOL_SIZE": str(max(args.concurrency, 5)),
+        }
+    )
+    prepare_database(args.database_url, reset=not args.no_reset)
+
+    from .report import format_table
+    from .runner import run
+    from .workloads import WORKLOADS
+
+    unknown = sorted(set(workloads) - set(WORKLOADS))
+    if unknown:
+        print(f"Unknown workloads: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    report = asyncio.run(run(args.cats, args.missions, args.requests, args.concurrency, workloads, args.seed))
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    print(format_table(report, baseline), file=sys.stderr)
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(rendered + "\n")
+    else:
+        print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
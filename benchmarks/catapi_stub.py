@@ -0,0 +1,63 @@
+import json
+
+import httpx
+
+STUB_BASE_URL = "http://thecatapi.stub/v1"
+STUB_ETAG = '"bench-breeds-v1"'
+
+BREEDS = [
+    "Abyssinian",
+    "Aegean",
+    "American Bobtail",
+    "American Curl",
+    "American Shorthair",
+    "Balinese",
+    "Bengal",
+    "Birman",
+    "Bombay",
+    "British Longhair",
+    "British Shorthair",
+    "Burmese",
+    "Chartreux",
+    "Cornish Rex",
+    "Devon Rex",
+    "Egyptian Mau",
+    "Exotic Shorthair",
+    "Havana Brown",
+    "Himalayan",
+    "Japanese Bobtail",
+    "Korat",
+    "Maine Coon",
+    "Manx",
+    "Norwegian Forest Cat",
+    "Ocicat",
+    "Persian",
+    "Ragdoll",
+    "Russian Blue",
+    "Savannah",
+    "Scottish Fold",
+    "Siamese",
+    "Siberian",
+    "Singapura",
+    "Somali",
+    "Sphynx",
+    "Tonkinese",
+    "Turkish Angora",
+    "Turkish Van",
+]
+
+
+def _handle(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/breeds"):
+        if request.headers.get("if-none-match") == STUB_ETAG:
+            return httpx.Response(304, headers={"ETag": STUB_ETAG})
+        body = json.dumps([{"id": name[:4].lower(), "name": name} for name in BREEDS])
+        return httpx.Response(200, content=body, headers={"ETag": STUB_ETAG, "Content-Type": "application/json"})
+    return httpx.Response(404)
+
+
+def install_catapi_stub() -> None:
+    """Point the app's shared TheCatAPI client at an in-process transport serving a fixed breed list."""
+    from app.clients import cat_api
+
+    cat_api._http_client = httpx.AsyncClient(transport=httpx.MockTransport(_handle))
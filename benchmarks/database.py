@@ -0,0 +1,21 @@
+from pathlib import Path
+
+from sqlalchemy.engine import make_url
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def prepare_database(url: str, reset: bool) -> None:
+    """Bring the database to the latest migration, wiping it first when `reset` is set."""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+    parsed = make_url(url)
+    if reset and parsed.get_backend_name() == "sqlite" and parsed.database:
+        Path(parsed.database).unlink(missing_ok=True)
+        Path(parsed.database).parent.mkdir(parents=True, exist_ok=True)
+    elif reset:
+        command.downgrade(config, "base")
+    command.upgrade(config, "head")
@@ -0,0 +1,133 @@
+"""Overload profile: send far more concurrent reads than the admission limits allow and check load is shed fast.
+
+Runs the same burst twice against the in-process app, once without limits and once with
+tight ones. It compares latency of served requests and checks that every rejection is
+fast and carries Retry-After. `python -m benchmarks.overload --max-reject-ms 50` exits
+non-zero when either check fails.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Any
+
+import httpx
+
+from .catapi_stub import STUB_BASE_URL, install_catapi_stub
+from .database import ROOT, prepare_database
+from .report import percentile
+
+DEFAULT_DATABASE_URL = f"sqlite+aiosqlite:///{ROOT / '.cache' / 'overload.sqlite3'}"
+READ_URL = "/missions?limit=50"
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.overload", description="Check admission control under overload.")
+    parser.add_argument(
+        "--database-url", default=os.environ.get("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL), help="database to run against"
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="requests in the burst")
+    parser.add_argument("--concurrency", type=int, default=200, help="concurrent clients")
+    parser.add_argument("--read-concurrency", type=int, default=8, help="ADMISSION_READ_CONCURRENCY for the limited run")
+    parser.add_argument("--max-queue", type=int, default=16, help="ADMISSION_MAX_QUEUE for the limited run")
+    parser.add_argument("--queue-timeout", type=float, default=0.25, help="ADMISSION_QUEUE_TIMEOUT_SECONDS for the limited run")
+    parser.add_argument("--retry-after-scale", type=float, default=1.0, help="clients pause Retry-After times this after a rejection")
+    parser.add_argument("--max-reject-ms", type=float, default=50.0, help="fail when rejected requests take longer than this at p95")
+    return parser.parse_args(argv)
+
+
+def _summarize(outcomes: list[tuple[int, float, str | None]], wall: float) -> dict[str, Any]:
+    served = sorted(elapsed for status, elapsed, _ in outcomes if status < 400)
+    rejected = sorted(elapsed for status, elapsed, _ in outcomes if status in (429, 503))
+    return {
+        "statuses": {str(status): count for status, count in sorted(Counter(status for status, _, _ in outcomes).items())},
+        "served_rps": round(len(served) / wall, 2) if wall else 0.0,
+        "served_ms": {f"p{pct}": round(percentile(served, pct) * 1000, 3) for pct in (50, 95, 99)},
+        "rejected_ms": {f"p{pct}": round(percentile(rejected, pct) * 1000, 3) for pct in (50, 95, 99)},
+        "rejected_without_retry_after": sum(1 for status, _, retry in outcomes if status in (429, 503) and retry is None),
+    }
+
+
+async def _burst(app: Any, requests: int, concurrency: int, retry_after_scale: float) -> dict[str, Any]:
+    outcomes: list[tuple[int, float, str | None]] = []
+    remaining = iter(range(requests))
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(READ_URL)
+            outcomes.append((response.status_code, time.perf_counter() - started, response.headers.get("retry-after")))
+            if response.status_code in (429, 503):
+                # Well-behaved clients honor Retry-After; clients hammering in a loop would also eat this process's CPU.
+                await asyncio.sleep(float(response.headers.get("retry-after", 1)) * retry_after_scale)
+
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client,
+    ):
+        while (await client.get("/ready")).status_code != 200:
+            await asyncio.sleep(0.01)
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+    return _summarize(outcomes, wall)
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    from app.db import dispose_engine, get_engine
+    from app.main import create_app
+    from app.settings import Settings
+
+    from .seed import seed
+
+    await seed(get_engine(), 200, 1000, random.Random(42))
+    install_catapi_stub()
+    limited = Settings(
+        ADMISSION_READ_CONCURRENCY=args.read_concurrency,
+        ADMISSION_MAX_QUEUE=args.max_queue,
+        ADMISSION_QUEUE_TIMEOUT_SECONDS=args.queue_timeout,
+    )
+    report = {
+        "unlimited": await _burst(
+            create_app(Settings(ADMISSION_READ_CONCURRENCY=0)), args.requests, args.concurrency, args.retry_after_scale
+        ),
+        "limited": await _burst(create_app(limited), args.requests, args.concurrency, args.retry_after_scale),
+    }
+    await dispose_engine()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    os.environ.update(
+        {
+            "DATABASE_URL": args.database_url,
+            "DATABASE_READ_URLS": "",
+            "CAT_API_BASE_URL": STUB_BASE_URL,
+            "BREED_CACHE_BACKEND": "memory",
+            "RATE_LIMIT_PER_SECOND": "0",
+        }
+    )
+    prepare_database(args.database_url, reset=True)
+    report = asyncio.run(_run(args))
+    for label, outcome in report.items():
+        print(
+            f"{label:<10} statuses {outcome['statuses']}  served {outcome['served_rps']} rps"
+            f"  served p95 {outcome['served_ms']['p95']} ms  rejected p95 {outcome['rejected_ms']['p95']} ms",
+            file=sys.stderr,
+        )
+    print(json.dumps(report, indent=2))
+    limited = report["limited"]
+    if limited["rejected_without_retry_after"] or limited["rejected_ms"]["p95"] > args.max_reject_ms:
+        print("Rejections were slow or missing Retry-After", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
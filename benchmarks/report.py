@@ -0,0 +1,54 @@
+import math
+from typing import Any
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(workload: str, latencies: list[float], queries: list[int], errors: int, wall_seconds: float) -> dict[str, Any]:
+    """Latency percentiles (ms), throughput and DB queries per request for one endpoint."""
+    ordered = sorted(latencies)
+    return {
+        "workload": workload,
+        "count": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / wall_seconds, 2) if wall_seconds else 0.0,
+        "latency_ms": {
+            **{f"p{pct}": round(percentile(ordered, pct) * 1000, 3) for pct in PERCENTILES},
+            "mean": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+            "max": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        },
+        "queries_per_request": {
+            "mean": round(sum(queries) / len(queries), 2) if queries else 0.0,
+            "max": max(queries, default=0),
+        },
+    }
+
+
+def _delta(current: float, previous: float | None) -> str:
+    if not previous:
+        return ""
+    return f" ({(current - previous) / previous * 100:+.1f}%)"
+
+
+def format_table(report: dict[str, Any], baseline: dict[str, Any] | None = None) -> str:
+    """Human-readable summary, with relative change against a baseline report when given."""
+    previous = (baseline or {}).get("endpoints", {})
+    lines = [f"{'endpoint':<52} {'n':>6} {'err':>4} {'rps':>18} {'p50 ms':>9} {'p95 ms':>20} {'p99 ms':>9} {'q/req':>6}"]
+    for endpoint, stats in report["endpoints"].items():
+        old = previous.get(endpoint, {})
+        latency = stats["latency_ms"]
+        rps = f"{stats['rps']:.1f}{_delta(stats['rps'], old.get('rps'))}"
+        p95 = f"{latency['p95']:.2f}{_delta(latency['p95'], old.get('latency_ms', {}).get('p95'))}"
+        lines.append(
+            f"{endpoint:<52} {stats['count']:>6} {stats['errors']:>4} {rps:>18} {latency['p50']:>9.2f} {p95:>20} "
+            f"{latency['p99']:>9.2f} {stats['queries_per_request']['mean']:>6.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,106 @@
+import asyncio
+import contextvars
+import platform
+import random
+import subprocess
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+from sqlalchemy import event
+
+from app.db import engine
+from app.main import app
+
+from .catapi_stub import install_catapi_stub
+from .report import summarize
+from .seed import seed
+from .workloads import WORKLOADS, Call
+
+_query_count: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar("bench_query_count", default=None)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_query(*_: Any) -> None:
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+class Results:
+    """Per-endpoint latencies, query counts and unexpected statuses collected by the workers."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.queries: dict[str, list[int]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+
+async def _worker(client: httpx.AsyncClient, calls: Any, results: Results) -> None:
+    for call in calls:
+        counter = [0]
+        token = _query_count.set(counter)
+        started = time.perf_counter()
+        try:
+            response = await client.request(call.method, call.url, json=call.json, params=call.params)
+        finally:
+            elapsed = time.perf_counter() - started
+            _query_count.reset(token)
+        results.latencies[call.endpoint].append(elapsed)
+        results.queries[call.endpoint].append(counter[0])
+        if response.status_code >= 400:
+            results.errors[call.endpoint] += 1
+
+
+async def run_workload(client: httpx.AsyncClient, name: str, calls: list[Call], concurrency: int) -> dict[str, Any]:
+    """Send `calls` through `concurrency` workers sharing one iterator; return per-endpoint summaries."""
+    results = Results()
+    shared = iter(calls)
+    started = time.perf_counter()
+    await asyncio.gather(*(_worker(client, shared, results) for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    endpoints = {
+        endpoint: summarize(name, latencies, results.queries[endpoint], results.errors[endpoint], wall)
+        for endpoint, latencies in results.latencies.items()
+    }
+    return {"seconds": round(wall, 3), "requests": len(calls), "rps": round(len(calls) / wall, 2) if wall else 0.0, "endpoints": endpoints}
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(cats: int, missions: int, requests: int, concurrency: int, workloads: list[str], seed_value: int) -> dict[str, Any]:
+    """Seed the database, run the selected workloads in order against the in-process app and build the report."""
+    rng = random.Random(seed_value)
+    data = await seed(engine, cats, missions, rng)
+    install_catapi_stub()
+    report: dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "database": engine.dialect.name,
+            "cats": cats,
+            "missions": missions,
+            "requests": requests,
+            "concurrency": concurrency,
+            "seed": seed_value,
+        },
+        "workloads": {},
+        "endpoints": {},
+    }
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in workloads:
+            calls = list(WORKLOADS[name](data, rng, requests))
+            outcome = await run_workload(client, name, calls, concurrency)
+            report["endpoints"].update(outcome.pop("endpoints"))
+            report["workloads"][name] = outcome
+    await engine.dispose()
+    return report
@@ -0,0 +1,85 @@
+import random
+import uuid
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db import AsyncSessionFactory
+from app.models import Cat, Mission, Target
+from app.services.stats_service import StatsService
+
+from .catapi_stub import BREEDS
+
+SEED_BATCH_SIZE = 1000
+COUNTRIES = ["US", "UK", "FR", "DE", "UA", "PL", "JP", "BR", "CA", "IT", "ES", "NL"]
+
+
+@dataclass
+class SeedData:
+    """Identifiers the workloads draw from: cats without a mission and missions without a cat."""
+
+    cat_ids: list[uuid.UUID] = field(default_factory=list)
+    free_cat_ids: list[uuid.UUID] = field(default_factory=list)
+    open_mission_ids: list[uuid.UUID] = field(default_factory=list)
+    unassigned_mission_ids: list[uuid.UUID] = field(default_factory=list)
+    open_targets: list[tuple[uuid.UUID, uuid.UUID]] = field(default_factory=list)
+
+
+async def _insert(engine: AsyncEngine, table, rows: list[dict]) -> None:
+    async with engine.begin() as conn:
+        for start in range(0, len(rows), SEED_BATCH_SIZE):
+            await conn.execute(insert(table), rows[start : start + SEED_BATCH_SIZE])
+
+
+async def seed(engine: AsyncEngine, cats: int, missions: int, rng: random.Random) -> SeedData:
+    """Insert `cats` cats and `missions` missions with 1–3 targets; half the cats get an open mission."""
+    data = SeedData()
+    cat_rows = [
+        {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "name": f"Agent {index:06d}",
+            "years_experience": rng.randint(0, 20),
+            "breed": rng.choice(BREEDS),
+            "salary": Decimal(rng.randint(100_000, 2_000_000)) / 100,
+        }
+        for index in range(cats)
+    ]
+    data.cat_ids = [row["id"] for row in cat_rows]
+    busy_cats = iter(data.cat_ids[: cats // 2])
+    data.free_cat_ids = data.cat_ids[cats // 2 :]
+
+    mission_rows: list[dict] = []
+    target_rows: list[dict] = []
+    for _ in range(missions):
+        mission_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+        complete = rng.random() < 0.2
+        assigned = None if complete else next(busy_cats, None)
+        mission_rows.append({"id": mission_id, "assigned_cat_id": assigned, "complete": complete})
+        if not complete:
+            data.open_mission_ids.append(mission_id)
+            if assigned is None:
+                data.unassigned_mission_ids.append(mission_id)
+        for index in range(rng.randint(1, 3)):
+            target_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+            target_rows.append(
+                {
+                    "id": target_id,
+                    "mission_id": mission_id,
+                    "name": f"Target {len(target_rows):07d}",
+                    "country": rng.choice(COUNTRIES),
+                    "notes": "" if index else "initial briefing",
+                    "complete": complete,
+                }
+            )
+            if not complete:
+                data.open_targets.append((mission_id, target_id))
+
+    await _insert(engine, Cat.__table__, cat_rows)
+    await _insert(engine, Mission.__table__, mission_rows)
+    await _insert(engine, Target.__table__, target_rows)
+    async with AsyncSessionFactory() as session:
+        await StatsService(session).rebuild()
+        await session.commit()
+    return data
@@ -0,0 +1,106 @@
+"""Cold-start profile: time from `import app.main` to the first 200 from /ready, in fresh interpreters.
+
+Run `python -m benchmarks.startup --runs 5 --max-ready-ms 3000`; it exits non-zero when the median
+import-to-ready time exceeds the budget, so it can gate CI.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DATABASE_URL = f"sqlite+aiosqlite:///{ROOT / '.cache' / 'startup.sqlite3'}"
+PHASES = ("import_ms", "serving_ms", "ready_ms")
+READY_POLL_SECONDS = 0.005
+
+
+def _probe() -> dict[str, float]:
+    """Measure one cold start in this interpreter; nothing from the app may be imported before this runs."""
+    started = time.perf_counter()
+    from app.main import app
+
+    imported = time.perf_counter()
+    import httpx
+
+    from .catapi_stub import install_catapi_stub
+
+    install_catapi_stub()
+
+    async def measure() -> tuple[float, float]:
+        async with app.router.lifespan_context(app):
+            serving = time.perf_counter()
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://startup") as client:
+                while (await client.get("/ready")).status_code != 200:
+                    await asyncio.sleep(READY_POLL_SECONDS)
+            return serving, time.perf_counter()
+
+    serving, ready = asyncio.run(measure())
+    return {
+        "import_ms": round((imported - started) * 1000, 1),
+        "serving_ms": round((serving - started) * 1000, 1),
+        "ready_ms": round((ready - started) * 1000, 1),
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description="Measure worker import-to-ready time.")
+    parser.add_argument(
+        "--database-url", default=os.environ.get("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL), help="database to start against"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to measure, each in a new interpreter")
+    parser.add_argument("--warm-db-connections", type=int, default=1, help="STARTUP_WARM_DB_CONNECTIONS for the measured workers")
+    parser.add_argument("--warm-breeds", action="store_true", help="require the breed cache before reporting ready")
+    parser.add_argument("--max-ready-ms", type=float, help="fail when the median import-to-ready time exceeds this budget")
+    parser.add_argument("--probe", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.probe:
+        print(json.dumps(_probe()))
+        return 0
+
+    from .catapi_stub import STUB_BASE_URL
+    from .database import prepare_database
+
+    env = {
+        **os.environ,
+        "DATABASE_URL": args.database_url,
+        "DATABASE_READ_URLS": "",
+        "CAT_API_BASE_URL": STUB_BASE_URL,
+        "BREED_CACHE_BACKEND": "memory",
+        "STARTUP_WARM_DB_CONNECTIONS": str(args.warm_db_connections),
+        "STARTUP_WARM_BREEDS": str(args.warm_breeds).lower(),
+    }
+    prepare_database(args.database_url, reset=False)
+    runs: list[dict[str, Any]] = []
+    for _ in range(args.runs):
+        probe = subprocess.run(
+            [sys.executable, "-m", "benchmarks.startup", "--probe"], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        runs.append(json.loads(probe.stdout.splitlines()[-1]))
+
+    report = {
+        "runs": runs,
+        "median": {phase: statistics.median(run[phase] for run in runs) for phase in PHASES},
+        "max": {phase: max(run[phase] for run in runs) for phase in PHASES},
+    }
+    for phase in PHASES:
+        print(f"{phase:<11} median {report['median'][phase]:>8.1f}  max {report['max'][phase]:>8.1f}", file=sys.stderr)
+    print(json.dumps(report, indent=2))
+    if args.max_ready_ms is not None and report["median"]["ready_ms"] > args.max_ready_ms:
+        print(f"Median import-to-ready {report['median']['ready_ms']:.1f} ms exceeds {args.max_ready_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import random
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .catapi_stub import BREEDS
+from .seed import COUNTRIES, SeedData
+
+
+@dataclass(frozen=True)
+class Call:
+    """One HTTP request of a workload; `endpoint` is the route template used to group results."""
+
+    endpoint: str
+    method: str
+    url: str
+    json: Any = None
+    params: dict[str, str] | None = None
+
+
+def create_calls(data: SeedData, rng: random.Random, count: int) -> Iterator[Call]:
+    for index in range(count):
+        if index % 2:
+            targets = [{"name": f"Bench target {index}-{n}", "country": rng.choice(COUNTRIES)} for n in range(rng.randint(1, 3))]
+            yield Call("POST /missions", "POST", "/missions", {"targets": targets})
+        else:
+            salary = f"{rng.randint(1000, 20000)}.00"
+            payload = {"name": f"Bench cat {index}", "years_experience": rng.randint(0, 15), "breed": rng.choice(BREEDS), "salary": salary}
+            yield Call("POST /cats", "POST", "/cats", payload)
+
+
+def assign_calls(data: SeedData, rng: random.Random, count: int) -> Iterator[Call]:
+    # Each call consumes a distinct free cat and unassigned mission so every request exercises the success path.
+    pairs = zip(data.unassigned_mission_ids, data.free_cat_ids, strict=False)
+    for _, (mission_id, cat_id) in zip(range(count), pairs, strict=False):
+        yield Call("POST /missions/{mission_id}/assign", "POST", f"/missions/{mission_id}/assign", {"cat_id": str(cat_id)})
+
+
+def update_target_calls(data: SeedData, rng: random.Random, count: int) -> Iterator[Call]:
+    for index in range(count):
+        mission_id, target_id = rng.choice(data.open_targets)
+        url = f"/missions/{mission_id}/targets/{target_id}"
+        yield Call("PATCH /missions/{mission_id}/targets/{target_id}", "PATCH", url, {"notes": f"Field report #{index}"})
+
+
+def list_calls(data: SeedData, rng: random.Random, count: int) -> Iterator[Call]:
+    variants: list[Call] = [
+        Call("GET /cats", "GET", "/cats", params={"limit": "50"}),
+        Call("GET /cats", "GET", "/cats", params={"limit": "50", "breed": rng.choice(BREEDS)}),
+        Call("GET /missions", "GET", "/missions", params={"limit": "50"}),
+        Call("GET /missions", "GET", "/missions", params={"limit": "50", "complete": "false"}),
+        Call("GET /missions", "GET", "/missions", params={"limit": "50", "country": rng.choice(COUNTRIES)}),
+    ]
+    for _ in range(count):
+        yield rng.choice(variants)
+
+
+WORKLOADS: dict[str, Callable[[SeedData, random.Random, int], Iterator[Call]]] = {
+    "create": create_calls,
+    "assign": assign_calls,
+    "update-target": update_target_calls,
+    "list": list_calls,
+}
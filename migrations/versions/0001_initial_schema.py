@@ -0,0 +1,55 @@
+"""Initial schema: cats, missions and targets as created by the former startup create_all.
+
+Databases created before migrations existed already have these tables; mark them with
+`alembic stamp 0001` and then run `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cats",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("years_experience", sa.Integer(), nullable=False),
+        sa.Column("breed", sa.String(100), nullable=False),
+        sa.Column("salary", sa.Numeric(10, 2), nullable=False),
+    )
+    op.create_table(
+        "missions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("assigned_cat_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("cats.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("complete", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_missions_assigned_cat_id", "missions", ["assigned_cat_id"])
+    op.create_table(
+        "targets",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("mission_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("missions.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("name", sa.String(150), nullable=False),
+        sa.Column("country", sa.String(80), nullable=False),
+        sa.Column("notes", sa.String(), nullable=False),
+        sa.Column("complete", sa.Boolean(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("targets")
+    op.drop_index("ix_missions_assigned_cat_id", table_name="missions")
+    op.drop_table("missions")
+    op.drop_table("cats")
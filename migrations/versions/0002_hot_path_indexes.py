@@ -0,0 +1,51 @@
+"""Indexes for the busy-cat check, target lookups and created_at-ordered listing.
+
+On PostgreSQL the indexes are built CONCURRENTLY so existing tables stay writable. Creating
+uq_missions_active_cat fails if a cat already holds two incomplete missions; resolve those first.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+OPEN_MISSION = sa.text("complete IS false")
+
+INDEXES = (
+    ("ix_targets_mission_id", "targets", ["mission_id"], {}),
+    (
+        "uq_missions_active_cat",
+        "missions",
+        ["assigned_cat_id"],
+        {"unique": True, "postgresql_where": OPEN_MISSION, "sqlite_where": OPEN_MISSION},
+    ),
+    ("ix_missions_created_at_id", "missions", ["created_at", "id"], {}),
+    ("ix_missions_assigned_cat_id_created_at", "missions", ["assigned_cat_id", "created_at", "id"], {}),
+    ("ix_missions_open_created_at", "missions", ["created_at", "id"], {"postgresql_where": OPEN_MISSION, "sqlite_where": OPEN_MISSION}),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Databases bootstrapped by create_all may already carry the active-cat index with a different predicate.
+        op.execute("DROP INDEX IF EXISTS uq_missions_active_cat")
+        for name, table, columns, options in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, **options)
+        # Superseded by ix_missions_assigned_cat_id_created_at, which serves the same lookups by prefix.
+        op.drop_index("ix_missions_assigned_cat_id", table_name="missions", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("ix_missions_assigned_cat_id", "missions", ["assigned_cat_id"], postgresql_concurrently=True)
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
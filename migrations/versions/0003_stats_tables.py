@@ -0,0 +1,71 @@
+"""Summary tables behind the /stats endpoints, backfilled from existing data.
+
+The application keeps them current incrementally from its write paths.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stat_counters",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+    )
+    op.create_table(
+        "breed_stats",
+        sa.Column("breed", sa.String(100), primary_key=True),
+        sa.Column("cats", sa.Integer(), nullable=False),
+        sa.Column("salary_total", sa.Numeric(14, 2), nullable=False),
+    )
+    op.create_table(
+        "country_stats",
+        sa.Column("country", sa.String(80), primary_key=True),
+        sa.Column("targets", sa.Integer(), nullable=False),
+        sa.Column("targets_completed", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "cat_stats",
+        sa.Column("cat_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("cats.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("missions_assigned", sa.Integer(), nullable=False),
+        sa.Column("missions_completed", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_cat_stats_missions_assigned", "cat_stats", ["missions_assigned", "cat_id"])
+
+    op.execute("INSERT INTO breed_stats (breed, cats, salary_total) SELECT breed, count(*), sum(salary) FROM cats GROUP BY breed")
+    op.execute(
+        "INSERT INTO country_stats (country, targets, targets_completed) "
+        "SELECT t.country, count(*), sum(CASE WHEN t.complete THEN 1 ELSE 0 END) FROM targets t "
+        "JOIN missions m ON m.id = t.mission_id GROUP BY t.country"
+    )
+    op.execute(
+        "INSERT INTO cat_stats (cat_id, missions_assigned, missions_completed) "
+        "SELECT assigned_cat_id, count(*), sum(CASE WHEN complete THEN 1 ELSE 0 END) FROM missions "
+        "WHERE assigned_cat_id IS NOT NULL GROUP BY assigned_cat_id"
+    )
+    op.execute(
+        "INSERT INTO stat_counters (name, value) "
+        "SELECT 'missions_active', count(*) FROM missions WHERE complete IS false "
+        "UNION ALL SELECT 'missions_completed', count(*) FROM missions WHERE complete IS true "
+        "UNION ALL SELECT 'cats_busy', count(DISTINCT assigned_cat_id) FROM missions WHERE complete IS false"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cat_stats")
+    op.drop_table("country_stats")
+    op.drop_table("breed_stats")
+    op.drop_table("stat_counters")
@@ -0,0 +1,43 @@
+"""Full-text search over targets: generated tsvector column with a GIN index (PostgreSQL only).
+
+The column is maintained by PostgreSQL on every insert/update, so edits to notes are searchable
+immediately. Adding a STORED generated column rewrites the targets table; schedule it accordingly.
+Other databases use the application's in-process index instead.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "ALTER TABLE targets ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english'::regconfig, name), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, country), 'B') || "
+        "setweight(to_tsvector('english'::regconfig, notes), 'C')) STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_targets_search_vector", "targets", [sa.text("search_vector")], postgresql_using="gin", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_targets_search_vector", table_name="targets", postgresql_concurrently=True)
+    op.execute("ALTER TABLE targets DROP COLUMN search_vector")
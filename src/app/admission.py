@@ -0,0 +1,180 @@
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict
+
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .metrics import registry
+from .settings import Settings, get_settings
+
+READ = "read"
+WRITE = "write"
+OUTBOUND = "outbound"
+STREAM = "stream"
+
+# Probes and scrapes must keep answering while the worker is overloaded.
+EXEMPT_PATHS = frozenset({"/health", "/ready", "/metrics"})
+# Endpoints that validate breeds against TheCatAPI before touching the database.
+OUTBOUND_PATHS = frozenset({"/cats", "/cats:bulk"})
+STREAM_PATHS = frozenset({"/events"})
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+ADMISSION_REJECTIONS = registry.counter(
+    "admission_rejections", "Requests turned away by rate limiting or concurrency limits.", ("route_class", "reason")
+)
+ADMISSION_QUEUE_WAIT = registry.histogram(
+    "admission_queue_wait_seconds", "Time admitted requests waited for a concurrency slot.", ("route_class",)
+)
+
+
+def route_class(method: str, path: str) -> str | None:
+    """Classify a request for admission control; None means it bypasses all limits."""
+    if path in EXEMPT_PATHS:
+        return None
+    if method in SAFE_METHODS:
+        return STREAM if path in STREAM_PATHS else READ
+    if method == "POST" and path in OUTBOUND_PATHS:
+        return OUTBOUND
+    return WRITE
+
+
+class TokenBuckets:
+    """Per-client token buckets refilled lazily on access and kept in an LRU map, so each check is O(1)."""
+
+    def __init__(self, rate: float, burst: int, max_clients: int = 10_000) -> None:
+        self.rate = rate
+        self.burst = float(max(burst, 1))
+        self.max_clients = max_clients
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def take(self, client: str, now: float | None = None) -> float:
+        """Spend one token; return 0 when allowed, otherwise seconds until the client has a token again."""
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            # Evicted clients come back with a full bucket, which only ever errs towards admitting.
+            bucket = self._buckets[client] = [self.burst, now]
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens >= 1:
+            bucket[0] = tokens - 1
+            return 0.0
+        bucket[0] = tokens
+        return (1 - tokens) / self.rate
+
+
+class ConcurrencyLimit:
+    """In-flight cap with a bounded wait queue; requests beyond both are rejected instead of piling up."""
+
+    def __init__(self, limit: int, max_waiting: int, wait_timeout: float) -> None:
+        self.limit = limit
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting up to `wait_timeout` when the queue has room; return False when rejected."""
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+        elif self.waiting >= self.max_waiting:
+            return False
+        else:
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.wait_timeout)
+            except TimeoutError:
+                return False
+            finally:
+                self.waiting -= 1
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+
+class AdmissionControlMiddleware:
+    """Pure ASGI middleware shedding load early: per-client rate limits (429) and per-route-class concurrency limits (503)."""
+
+    def __init__(self, app: ASGIApp, settings: Settings | None = None) -> None:
+        self.app = app
+        settings = settings or get_settings()
+        self.client_header = settings.rate_limit_client_header.lower().encode() if settings.rate_limit_client_header else None
+        self.buckets = (
+            TokenBuckets(settings.rate_limit_per_second, settings.rate_limit_burst, settings.rate_limit_max_clients)
+            if settings.rate_limit_per_second > 0
+            else None
+        )
+        self.retry_after = settings.admission_retry_after_seconds
+        limits = {
+            READ: settings.admission_read_concurrency,
+            WRITE: settings.admission_write_concurrency,
+            OUTBOUND: settings.admission_outbound_concurrency,
+        }
+        self.limits = {
+            name: ConcurrencyLimit(limit, settings.admission_max_queue, settings.admission_queue_timeout_seconds)
+            for name, limit in limits.items()
+            if limit > 0
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        kind = route_class(scope["method"], scope["path"])
+        if kind is None:
+            await self.app(scope, receive, send)
+            return
+        if self.buckets is not None:
+            wait = self.buckets.take(self._client(scope))
+            if wait:
+                ADMISSION_REJECTIONS.inc(route_class=kind, reason="rate_limited")
+                await _reject(send, status.HTTP_429_TOO_MANY_REQUESTS, "Rate limit exceeded", wait)
+                return
+        limit = self.limits.get(kind)
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        if not await limit.acquire():
+            ADMISSION_REJECTIONS.inc(route_class=kind, reason="overloaded")
+            await _reject(send, status.HTTP_503_SERVICE_UNAVAILABLE, "Server is busy, retry later", self.retry_after)
+            return
+        ADMISSION_QUEUE_WAIT.observe(time.perf_counter() - started, route_class=kind)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limit.release()
+
+    def _client(self, scope: Scope) -> str:
+        if self.client_header is not None:
+            for name, value in scope["headers"]:
+                if name == self.client_header:
+                    # X-Forwarded-For style lists: the first entry is the original client.
+                    return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+
+async def _reject(send: Send, status_code: int, detail: str, retry_after: float) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+        (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+    ]
+    await send({"type": "http.response.start", "status": status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
@@ -1,16 +1,23 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..deps import get_db_session
-from ..schemas.cats import CatCreate, CatRead, CatUpdateSalary
+from ..deps import get_db_session, get_read_db_session
+from ..idempotency import IdempotencyKeyHeader, idempotent
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from ..response_cache import cached_json_response, response_cache
+from ..schemas.cats import CatBulkCreate, CatBulkResult, CatCreate, CatRead, CatUpdateSalary
 from ..services.cat_service import CatService
+from .encoding import encode_json, json_response
+from .streaming import NDJSON_MEDIA_TYPE, ndjson_response
 
 router = APIRouter(prefix="/cats", tags=["cats"])
 
 SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db_session)]
 
 
 def get_cat_service(session: SessionDep) -> CatService:
@@ -18,22 +25,60 @@ def get_cat_service(session: SessionDep) -> CatService:
     return CatService(session)
 
 
+def get_cat_read_service(session: ReadSessionDep) -> CatService:
+    """Build CatService whose reads are routed to a read replica."""
+    return CatService(session)
+
+
 @router.post("", response_model=CatRead, status_code=status.HTTP_201_CREATED)
-async def create_cat(payload: CatCreate, service: Annotated[CatService, Depends(get_cat_service)]) -> CatRead:
-    """Create a new cat."""
-    return await service.create_cat(payload)
+async def create_cat(
+    payload: CatCreate,
+    request: Request,
+    service: Annotated[CatService, Depends(get_cat_service)],
+    idempotency_key: IdempotencyKeyHeader = None,
+) -> Response:
+    """Create a new cat; retries with the same Idempotency-Key get the first response."""
+
+    async def create() -> Response:
+        return json_response(await service.create_cat(payload), CatRead, status.HTTP_201_CREATED)
+
+    return await idempotent(idempotency_key, request, payload, create)
+
+
+@router.post(":bulk", response_model=list[CatBulkResult])
+async def bulk_create_cats(payload: CatBulkCreate, service: Annotated[CatService, Depends(get_cat_service)]) -> Response:
+    """Create many cats at once, reporting the created cat or an error for each item."""
+    return json_response(await service.bulk_create_cats(payload), list[CatBulkResult])
 
 
 @router.get("", response_model=list[CatRead])
-async def list_cats(service: Annotated[CatService, Depends(get_cat_service)]) -> list[CatRead]:
-    """List all cats."""
-    return await service.list_cats()
+async def list_cats(
+    service: Annotated[CatService, Depends(get_cat_read_service)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    breed: str | None = None,
+) -> Response:
+    """List cats page by page; the next page cursor is returned in the X-Next-Cursor header."""
+    cats, next_cursor = await service.list_cats(limit=limit, cursor=cursor, breed=breed)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor is not None else None
+    return json_response(cats, list[CatRead], headers=headers)
+
+
+@router.get("/export", response_class=StreamingResponse, responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}})
+async def export_cats(service: Annotated[CatService, Depends(get_cat_read_service)]) -> StreamingResponse:
+    """Stream all cats as newline-delimited JSON."""
+    return ndjson_response(service.export_cats(), CatRead)
 
 
 @router.get("/{cat_id}", response_model=CatRead)
-async def get_cat(cat_id: UUID, service: Annotated[CatService, Depends(get_cat_service)]) -> CatRead:
-    """Get a single cat by id."""
-    return await service.get_cat(cat_id)
+async def get_cat(cat_id: UUID, request: Request, service: Annotated[CatService, Depends(get_cat_read_service)]) -> Response:
+    """Get a single cat by id, served from the response cache with ETag revalidation."""
+    entry = response_cache.get("cat", cat_id)
+    if entry is None:
+        generation = response_cache.generation()
+        cat = await service.get_cat(cat_id)
+        entry = response_cache.put("cat", cat_id, encode_json(cat, CatRead), generation)
+    return cached_json_response(entry, request)
 
 
 @router.patch("/{cat_id}/salary", response_model=CatRead)
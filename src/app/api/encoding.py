@@ -0,0 +1,29 @@
+import time
+from functools import cache
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+from ..instrumentation import record_serialization
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@cache
+def _adapter(annotation: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(annotation)
+
+
+def encode_json(value: Any, annotation: Any) -> bytes:
+    """Validate rows or ORM objects against a response type and dump them to JSON in pydantic-core."""
+    started = time.perf_counter()
+    adapter = _adapter(annotation)
+    body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    record_serialization(time.perf_counter() - started)
+    return body
+
+
+def json_response(value: Any, annotation: Any, status_code: int = status.HTTP_200_OK, headers: dict[str, str] | None = None) -> Response:
+    """Build a JSON response without FastAPI's jsonable_encoder and response_model re-validation."""
+    return Response(content=encode_json(value, annotation), status_code=status_code, media_type=JSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,53 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+
+from ..deps import get_app_settings
+from ..events import Subscription, broker
+from ..settings import Settings
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+
+async def _event_stream(subscription: Subscription, heartbeat_seconds: float, max_events: int | None) -> AsyncIterator[bytes]:
+    sent = 0
+    if subscription.missed_history:
+        yield b"event: reset\ndata: {}\n\n"
+        sent += 1
+    while max_events is None or sent < max_events:
+        if subscription.overflowed and subscription.queue.empty():
+            # The client fell too far behind; it reconnects with Last-Event-ID and resumes from the history.
+            yield b"event: overflow\ndata: {}\n\n"
+            return
+        try:
+            event = await asyncio.wait_for(subscription.queue.get(), heartbeat_seconds)
+        except TimeoutError:
+            yield b": keep-alive\n\n"
+            continue
+        yield event.encode()
+        sent += 1
+
+
+@router.get("", response_class=StreamingResponse, responses={200: {"content": {EVENT_STREAM_MEDIA_TYPE: {}}}})
+async def stream_events(
+    settings: Annotated[Settings, Depends(get_app_settings)],
+    mission_id: UUID | None = None,
+    cat_id: UUID | None = None,
+    max_events: Annotated[int | None, Query(ge=1)] = None,
+    last_event_id: Annotated[int | None, Header(alias="Last-Event-ID")] = None,
+) -> StreamingResponse:
+    """Server-sent events for target updates, assignments and completions of one mission, one cat's missions, or all missions."""
+
+    async def stream() -> AsyncIterator[bytes]:
+        with broker.subscribe(mission_id, cat_id, last_event_id) as subscription:
+            async for frame in _event_stream(subscription, settings.events_heartbeat_seconds, max_events):
+                yield frame
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(stream(), media_type=EVENT_STREAM_MEDIA_TYPE, headers=headers)
@@ -1,16 +1,32 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..deps import get_db_session
-from ..schemas.missions import MissionAssign, MissionCreate, MissionRead, TargetRead, TargetUpdate
+from ..deps import get_db_session, get_read_db_session
+from ..idempotency import IdempotencyKeyHeader, idempotent
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from ..response_cache import cached_json_response, response_cache
+from ..schemas.missions import (
+    MissionAssign,
+    MissionBulkCreate,
+    MissionBulkResult,
+    MissionCreate,
+    MissionRead,
+    TargetBatchUpdate,
+    TargetRead,
+    TargetUpdate,
+)
 from ..services.mission_service import MissionService
+from .encoding import encode_json, json_response
+from .streaming import NDJSON_MEDIA_TYPE, ndjson_response
 
 router = APIRouter(prefix="/missions", tags=["missions"])
 
 SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db_session)]
 
 
 def get_mission_service(session: SessionDep) -> MissionService:
@@ -18,22 +34,66 @@ def get_mission_service(session: SessionDep) -> MissionService:
     return MissionService(session)
 
 
+def get_mission_read_service(session: ReadSessionDep) -> MissionService:
+    """Build MissionService whose reads are routed to a read replica."""
+    return MissionService(session)
+
+
 @router.post("", response_model=MissionRead, status_code=status.HTTP_201_CREATED)
-async def create_mission(payload: MissionCreate, service: Annotated[MissionService, Depends(get_mission_service)]) -> MissionRead:
-    """Create a mission with 1–3 targets."""
-    return await service.create_mission(payload)
+async def create_mission(
+    payload: MissionCreate,
+    request: Request,
+    service: Annotated[MissionService, Depends(get_mission_service)],
+    idempotency_key: IdempotencyKeyHeader = None,
+) -> Response:
+    """Create a mission with 1–3 targets; retries with the same Idempotency-Key get the first response."""
+
+    async def create() -> Response:
+        return json_response(await service.create_mission(payload), MissionRead, status.HTTP_201_CREATED)
+
+    return await idempotent(idempotency_key, request, payload, create)
+
+
+@router.post(":bulk", response_model=list[MissionBulkResult])
+async def bulk_create_missions(payload: MissionBulkCreate, service: Annotated[MissionService, Depends(get_mission_service)]) -> Response:
+    """Create many missions with targets at once, reporting the outcome for each item."""
+    return json_response(await service.bulk_create_missions(payload), list[MissionBulkResult])
 
 
 @router.get("", response_model=list[MissionRead])
-async def list_missions(service: Annotated[MissionService, Depends(get_mission_service)]) -> list[MissionRead]:
-    """List all missions with targets."""
-    return await service.list_missions()
+async def list_missions(
+    service: Annotated[MissionService, Depends(get_mission_read_service)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    complete: bool | None = None,
+    assigned_cat_id: UUID | None = None,
+    country: str | None = None,
+) -> Response:
+    """List missions with targets page by page; the next page cursor is returned in the X-Next-Cursor header."""
+    missions, next_cursor = await service.list_missions(
+        limit=limit, cursor=cursor, complete=complete, assigned_cat_id=assigned_cat_id, country=country
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor is not None else None
+    return json_response(missions, list[MissionRead], headers=headers)
+
+
+@router.get("/export", response_class=StreamingResponse, responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}})
+async def export_missions(service: Annotated[MissionService, Depends(get_mission_read_service)]) -> StreamingResponse:
+    """Stream all missions with targets as newline-delimited JSON."""
+    return ndjson_response(service.export_missions(), MissionRead)
 
 
 @router.get("/{mission_id}", response_model=MissionRead)
-async def get_mission(mission_id: UUID, service: Annotated[MissionService, Depends(get_mission_service)]) -> MissionRead:
-    """Get mission details with targets."""
-    return await service.get_mission(mission_id)
+async def get_mission(
+    mission_id: UUID, request: Request, service: Annotated[MissionService, Depends(get_mission_read_service)]
+) -> Response:
+    """Get mission details with targets, served from the response cache with ETag revalidation."""
+    entry = response_cache.get("mission", mission_id)
+    if entry is None:
+        generation = response_cache.generation()
+        mission = await service.get_mission(mission_id)
+        entry = response_cache.put("mission", mission_id, encode_json(mission, MissionRead), generation)
+    return cached_json_response(entry, request)
 
 
 @router.delete("/{mission_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -45,10 +105,29 @@ async def delete_mission(mission_id: UUID, service: Annotated[MissionService, De
 
 @router.post("/{mission_id}/assign", response_model=MissionRead)
 async def assign_cat(
-    mission_id: UUID, payload: MissionAssign, service: Annotated[MissionService, Depends(get_mission_service)]
-) -> MissionRead:
-    """Assign cat to mission with busy checks."""
-    return await service.assign_cat(mission_id, payload)
+    mission_id: UUID,
+    payload: MissionAssign,
+    request: Request,
+    service: Annotated[MissionService, Depends(get_mission_service)],
+    idempotency_key: IdempotencyKeyHeader = None,
+) -> Response:
+    """Assign cat to mission with busy checks; retries with the same Idempotency-Key get the first response."""
+
+    async def assign() -> Response:
+        return json_response(await service.assign_cat(mission_id, payload), MissionRead)
+
+    return await idempotent(idempotency_key, request, payload, assign)
+
+
+@router.patch("/{mission_id}/targets", response_model=list[TargetRead])
+async def update_targets(
+    mission_id: UUID,
+    payload: TargetBatchUpdate,
+    service: Annotated[MissionService, Depends(get_mission_service)],
+) -> Response:
+    """Update notes or completion of several targets in one transaction; nothing is applied if any target is rejected."""
+    targets = await service.update_targets(mission_id, payload)
+    return json_response(targets, list[TargetRead])
 
 
 @router.patch("/{mission_id}/targets/{target_id}", response_model=TargetRead)
@@ -0,0 +1,48 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..deps import get_read_db_session
+from ..schemas.stats import CatUtilizationStats, MissionStats, PayrollStats, TargetStats
+from ..services.stats_service import DEFAULT_TOP_CATS, StatsService
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db_session)]
+
+MAX_TOP_CATS = 100
+
+
+def get_stats_service(session: ReadSessionDep) -> StatsService:
+    """Build StatsService whose reads are routed to a read replica."""
+    return StatsService(session)
+
+
+StatsServiceDep = Annotated[StatsService, Depends(get_stats_service)]
+
+
+@router.get("/payroll", response_model=PayrollStats)
+async def payroll_stats(service: StatsServiceDep) -> PayrollStats:
+    """Payroll sum and average overall and by breed."""
+    return await service.payroll()
+
+
+@router.get("/missions", response_model=MissionStats)
+async def mission_stats(service: StatsServiceDep) -> MissionStats:
+    """Active vs. completed missions and the completion rate."""
+    return await service.missions()
+
+
+@router.get("/cats", response_model=CatUtilizationStats)
+async def cat_stats(
+    service: StatsServiceDep, limit: Annotated[int, Query(ge=1, le=MAX_TOP_CATS)] = DEFAULT_TOP_CATS
+) -> CatUtilizationStats:
+    """Cat utilization and the cats with the most missions."""
+    return await service.cats(limit)
+
+
+@router.get("/targets", response_model=TargetStats)
+async def target_stats(service: StatsServiceDep) -> TargetStats:
+    """Target totals and completion by country."""
+    return await service.targets()
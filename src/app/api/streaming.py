@@ -0,0 +1,25 @@
+from collections.abc import AsyncIterator, Mapping
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+LINES_PER_CHUNK = 500
+
+
+async def _ndjson_chunks(rows: AsyncIterator[Mapping[str, Any]], model: type[BaseModel]) -> AsyncIterator[bytes]:
+    """Encode mappings as NDJSON lines, flushing a bounded chunk at a time."""
+    buffer: list[bytes] = []
+    async for row in rows:
+        buffer.append(model.model_validate(row).model_dump_json().encode())
+        if len(buffer) >= LINES_PER_CHUNK:
+            yield b"\n".join(buffer) + b"\n"
+            buffer.clear()
+    if buffer:
+        yield b"\n".join(buffer) + b"\n"
+
+
+def ndjson_response(rows: AsyncIterator[Mapping[str, Any]], model: type[BaseModel]) -> StreamingResponse:
+    """Build a streaming NDJSON response serializing each row with the given response model."""
+    return StreamingResponse(_ndjson_chunks(rows, model), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,33 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..deps import get_read_db_session
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from ..schemas.missions import TargetSearchHit
+from ..services.search_service import TargetSearchService
+from .encoding import json_response
+
+router = APIRouter(prefix="/targets", tags=["targets"])
+
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db_session)]
+
+
+def get_search_service(session: ReadSessionDep) -> TargetSearchService:
+    """Build TargetSearchService whose reads are routed to a read replica."""
+    return TargetSearchService(session)
+
+
+@router.get("/search", response_model=list[TargetSearchHit])
+async def search_targets(
+    service: Annotated[TargetSearchService, Depends(get_search_service)],
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    mission_complete: bool | None = None,
+) -> Response:
+    """Full-text search over target name, country and notes, best matches first; next page cursor in X-Next-Cursor."""
+    hits, next_cursor = await service.search(q, limit=limit, cursor=cursor, mission_complete=mission_complete)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor is not None else None
+    return json_response(hits, list[TargetSearchHit], headers=headers)
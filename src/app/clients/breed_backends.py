@@ -0,0 +1,154 @@
+import asyncio
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Protocol
+from uuid import uuid4
+
+from pydantic import BaseModel, ValidationError
+
+from ..settings import Settings
+
+
+class BreedSnapshot(BaseModel):
+    """Breed list shared between workers together with its validators."""
+
+    breeds: list[str]
+    etag: str | None = None
+    fetched_at: datetime
+
+
+class BreedCacheBackend(Protocol):
+    """Shared storage for the last good breed snapshot plus a cross-worker refresh lock."""
+
+    async def load(self) -> BreedSnapshot | None: ...
+
+    async def store(self, snapshot: BreedSnapshot) -> None: ...
+
+    async def acquire_refresh_lock(self, ttl_seconds: int) -> bool: ...
+
+    async def release_refresh_lock(self) -> None: ...
+
+
+class MemoryBreedBackend:
+    """Process-local backend; every worker refreshes on its own."""
+
+    def __init__(self) -> None:
+        self._snapshot: BreedSnapshot | None = None
+
+    async def load(self) -> BreedSnapshot | None:
+        return self._snapshot
+
+    async def store(self, snapshot: BreedSnapshot) -> None:
+        self._snapshot = snapshot
+
+    async def acquire_refresh_lock(self, ttl_seconds: int) -> bool:
+        return True
+
+    async def release_refresh_lock(self) -> None:
+        return None
+
+
+class FileBreedBackend:
+    """Snapshot file shared by workers on one host, with an O_EXCL lock file for single-flight refresh."""
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self._holds_lock = False
+
+    async def load(self) -> BreedSnapshot | None:
+        return await asyncio.to_thread(self._read)
+
+    async def store(self, snapshot: BreedSnapshot) -> None:
+        await asyncio.to_thread(self._write, snapshot)
+
+    async def acquire_refresh_lock(self, ttl_seconds: int) -> bool:
+        self._holds_lock = await asyncio.to_thread(self._try_lock, ttl_seconds)
+        return self._holds_lock
+
+    async def release_refresh_lock(self) -> None:
+        if self._holds_lock:
+            self._holds_lock = False
+            await asyncio.to_thread(self.lock_path.unlink, missing_ok=True)
+
+    def _read(self) -> BreedSnapshot | None:
+        try:
+            return BreedSnapshot.model_validate_json(self.path.read_bytes())
+        except (OSError, ValidationError):
+            return None
+
+    def _write(self, snapshot: BreedSnapshot) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(snapshot.model_dump_json())
+        os.replace(tmp, self.path)
+
+    def _try_lock(self, ttl_seconds: int) -> bool:
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if time.time() - self.lock_path.stat().st_mtime > ttl_seconds:
+                # The holder died mid-refresh; break the abandoned lock.
+                self.lock_path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
+        try:
+            os.close(os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return False
+        return True
+
+
+class RedisBreedBackend:
+    """Backend for any client exposing the redis.asyncio get/set/delete interface."""
+
+    def __init__(self, client: Any, key: str = "spy-cat-agency:breeds") -> None:
+        self.client = client
+        self.key = key
+        self.lock_key = f"{key}:refresh-lock"
+        self._lock_token: str | None = None
+
+    async def load(self) -> BreedSnapshot | None:
+        raw = await self.client.get(self.key)
+        if raw is None:
+            return None
+        try:
+            return BreedSnapshot.model_validate_json(raw)
+        except ValidationError:
+            return None
+
+    async def store(self, snapshot: BreedSnapshot) -> None:
+        await self.client.set(self.key, snapshot.model_dump_json())
+
+    async def acquire_refresh_lock(self, ttl_seconds: int) -> bool:
+        token = uuid4().hex
+        if await self.client.set(self.lock_key, token, nx=True, ex=ttl_seconds):
+            self._lock_token = token
+            return True
+        return False
+
+    async def release_refresh_lock(self) -> None:
+        token, self._lock_token = self._lock_token, None
+        if token is None:
+            return
+        current = await self.client.get(self.lock_key)
+        if isinstance(current, bytes):
+            current = current.decode()
+        if current == token:
+            await self.client.delete(self.lock_key)
+
+
+def build_breed_backend(settings: Settings) -> BreedCacheBackend:
+    """Create the breed cache backend selected by BREED_CACHE_BACKEND."""
+    if settings.breed_cache_backend == "redis":
+        if not settings.redis_url:
+            raise RuntimeError("BREED_CACHE_BACKEND=redis requires REDIS_URL")
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:
+            raise RuntimeError("BREED_CACHE_BACKEND=redis requires the 'redis' package (pip install .[redis])") from exc
+        return RedisBreedBackend(redis_asyncio.from_url(settings.redis_url))
+    if settings.breed_cache_backend == "file" and settings.breed_snapshot_path:
+        return FileBreedBackend(settings.breed_snapshot_path)
+    return MemoryBreedBackend()
@@ -1,17 +1,83 @@
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 
 import httpx
 
 from ..settings import get_settings
+from .breed_backends import BreedCacheBackend, BreedSnapshot, MemoryBreedBackend, build_breed_backend
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_breed(name: str) -> str:
+    """Casefold and collapse whitespace so lookups ignore spelling noise."""
+    return " ".join(name.split()).casefold()
+
+
+def _trigrams(value: str) -> set[str]:
+    padded = f"  {value} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class BreedIndex:
+    """Immutable lookup structures built once per breed refresh."""
+
+    def __init__(self, breeds: list[str]) -> None:
+        canonical: dict[str, str] = {}
+        for breed in breeds:
+            canonical.setdefault(normalize_breed(breed), breed)
+        self._canonical = canonical
+        grams: dict[str, set[str]] = {}
+        self._gram_counts: dict[str, int] = {}
+        for key, breed in canonical.items():
+            key_grams = _trigrams(key)
+            self._gram_counts[breed] = len(key_grams)
+            for gram in key_grams:
+                grams.setdefault(gram, set()).add(breed)
+        self._grams = {gram: frozenset(names) for gram, names in grams.items()}
+
+    def __contains__(self, breed: str) -> bool:
+        return normalize_breed(breed) in self._canonical
+
+    def canonical(self, breed: str) -> str | None:
+        """Return TheCatAPI spelling for a breed, or None when unknown."""
+        return self._canonical.get(normalize_breed(breed))
+
+    def suggest(self, breed: str, limit: int = 3, min_score: float = 0.3) -> list[str]:
+        """Return closest known breeds by trigram Jaccard similarity."""
+        query = _trigrams(normalize_breed(breed))
+        shared: Counter[str] = Counter()
+        for gram in query:
+            shared.update(self._grams.get(gram, ()))
+        scored = [(count / (len(query) + self._gram_counts[name] - count), name) for name, count in shared.items()]
+        scored = [item for item in scored if item[0] >= min_score]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [name for _, name in scored[:limit]]
+
+
+BreedFetcher = Callable[[str | None], Awaitable[tuple[list[str] | None, str | None]]]
+
+REFRESH_LOCK_SECONDS = 30
+SHARED_REFRESH_POLLS = 20
+SHARED_REFRESH_POLL_SECONDS = 0.25
 
 
 class BreedCache:
-    """In-memory TTL cache for cat breeds."""
+    """In-memory TTL cache for cat breeds with single-flight refresh and stale-while-revalidate."""
 
-    def __init__(self, ttl_seconds: int = 300) -> None:
+    def __init__(self, ttl_seconds: int = 300, max_stale_seconds: int = 3600, backend: BreedCacheBackend | None = None) -> None:
         self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_stale = timedelta(seconds=max_stale_seconds)
+        self.backend: BreedCacheBackend = backend or MemoryBreedBackend()
         self.breeds: list[str] = []
+        self.index = BreedIndex([])
+        self.etag: str | None = None
         self.fetched_at: datetime | None = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[list[str]] | None = None
 
     def is_fresh(self) -> bool:
         """Return True when cached data is within TTL window."""
@@ -19,32 +85,145 @@ class BreedCache:
             return False
         return datetime.utcnow() - self.fetched_at < self.ttl
 
-    def update(self, breeds: list[str]) -> None:
-        """Update cache contents and timestamp."""
+    def is_servable(self) -> bool:
+        """Return True when cached data may still be served while a refresh runs."""
+        if self.fetched_at is None:
+            return False
+        return datetime.utcnow() - self.fetched_at < self.ttl + self.max_stale
+
+    def update(self, breeds: list[str], etag: str | None = None, fetched_at: datetime | None = None) -> None:
+        """Update cache contents, rebuild the lookup index and bump the timestamp."""
         self.breeds = breeds
-        self.fetched_at = datetime.utcnow()
+        self.index = BreedIndex(breeds)
+        self.etag = etag
+        self.fetched_at = fetched_at or datetime.utcnow()
+
+    async def load_shared(self) -> bool:
+        """Adopt the backend snapshot when it is newer than local data; return True when now fresh."""
+        snapshot = await self.backend.load()
+        if snapshot is not None and (self.fetched_at is None or snapshot.fetched_at > self.fetched_at):
+            self.update(snapshot.breeds, snapshot.etag, snapshot.fetched_at)
+        return self.is_fresh()
+
+    async def refresh(self, fetch: BreedFetcher) -> list[str]:
+        """Revalidate breeds once per process and, through the backend lock, once across workers."""
+        async with self._lock:
+            if self.is_fresh() or await self.load_shared():
+                return self.breeds
+            if await self.backend.acquire_refresh_lock(REFRESH_LOCK_SECONDS):
+                try:
+                    await self._revalidate(fetch)
+                finally:
+                    await self.backend.release_refresh_lock()
+                return self.breeds
+            # Another worker is refreshing: serve what we have or wait briefly for its snapshot.
+            if self.is_servable():
+                return self.breeds
+            for _ in range(SHARED_REFRESH_POLLS):
+                await asyncio.sleep(SHARED_REFRESH_POLL_SECONDS)
+                if await self.load_shared():
+                    return self.breeds
+            await self._revalidate(fetch)
+            return self.breeds
+
+    async def _revalidate(self, fetch: BreedFetcher) -> None:
+        breeds, etag = await fetch(self.etag)
+        if breeds is None:
+            self.fetched_at = datetime.utcnow()
+        else:
+            self.update(breeds, etag)
+        await self.backend.store(BreedSnapshot(breeds=self.breeds, etag=self.etag, fetched_at=self.fetched_at))
 
+    def refresh_in_background(self, fetch: BreedFetcher) -> None:
+        """Start a background refresh unless one is already running."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self.refresh(fetch))
+        self._refresh_task.add_done_callback(_log_refresh_failure)
 
-breed_cache = BreedCache()
+    async def cancel_refresh(self) -> None:
+        """Cancel a pending background refresh, used on application shutdown."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
 
 
-async def fetch_breeds() -> list[str]:
-    """Fetch breed names from TheCatAPI."""
+def _log_refresh_failure(task: asyncio.Task[list[str]]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background breed refresh failed", exc_info=task.exception())
+
+
+def _build_breed_cache() -> BreedCache:
+    settings = get_settings()
+    return BreedCache(settings.breed_cache_ttl_seconds, settings.breed_max_stale_seconds, build_breed_backend(settings))
+
+
+breed_cache = _build_breed_cache()
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive client for TheCatAPI, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and stop any pending breed refresh."""
+    global _http_client
+    await breed_cache.cancel_refresh()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def fetch_breeds(etag: str | None = None) -> tuple[list[str] | None, str | None]:
+    """Fetch breed names from TheCatAPI; returns (None, etag) when the conditional request is not modified."""
     settings = get_settings()
     base_url = settings.cat_api_base_url or "https://api.thecatapi.com/v1"
     url = f"{base_url}/breeds"
-    async with httpx.AsyncClient(timeout=10) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        data = response.json()
-    return [item.get("name", "") for item in data if "name" in item]
+    headers = {"If-None-Match": etag} if etag else {}
+    response = await get_http_client().get(url, headers=headers)
+    if response.status_code == 304:
+        return None, etag
+    response.raise_for_status()
+    data = response.json()
+    return [item.get("name", "") for item in data if "name" in item], response.headers.get("ETag")
+
+
+async def load_breed_snapshot() -> bool:
+    """Load the shared breed snapshot at startup and revalidate it in the background when stale."""
+    await breed_cache.load_shared()
+    if breed_cache.fetched_at is None:
+        return False
+    if not breed_cache.is_fresh():
+        breed_cache.refresh_in_background(fetch_breeds)
+    return True
+
+
+async def get_breeds() -> list[str]:
+    """Return cached breed names, serving stale data while a single background refresh runs."""
+    if breed_cache.is_fresh():
+        return breed_cache.breeds
+    if breed_cache.is_servable():
+        breed_cache.refresh_in_background(fetch_breeds)
+        return breed_cache.breeds
+    return await breed_cache.refresh(fetch_breeds)
+
+
+async def get_breed_index() -> BreedIndex:
+    """Return the precomputed breed index, refreshing the cache first when needed."""
+    await get_breeds()
+    return breed_cache.index
 
 
 async def validate_breed(breed: str) -> bool:
     """Validate breed name using cached list of breeds from TheCatAPI."""
-    if not breed_cache.is_fresh():
-        breeds = await fetch_breeds()
-        breed_cache.update(breeds)
-    else:
-        breeds = breed_cache.breeds
-    return breed.lower() in {b.lower() for b in breeds}
+    return breed in await get_breed_index()
@@ -1,9 +1,25 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
 
+from sqlalchemy import Select, event, text
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from .settings import get_settings
+from .instrumentation import DB_QUERY_DURATION, DB_SLOW_QUERIES, current_request_stats, normalize_sql
+from .metrics import registry
+from .settings import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+POOL_CHECKOUT_WAIT = registry.histogram("db_pool_checkout_wait_seconds", "Time spent waiting for a pooled DB connection.")
+POOL_TIMEOUTS = registry.counter("db_pool_checkout_timeouts", "Connection checkouts that hit the pool timeout.")
 
 
 class Base(DeclarativeBase):
@@ -12,17 +28,208 @@ class Base(DeclarativeBase):
     pass
 
 
-def _build_engine() -> AsyncEngine:
-    """Create async SQLAlchemy engine from settings."""
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool recording checkout wait time and pool timeouts."""
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def _connect_args(settings: Settings, url: str) -> dict[str, Any]:
+    """Driver options for statement timeout and prepared statement caching."""
+    if make_url(url).get_driver_name() != "asyncpg":
+        return {}
+    args: dict[str, Any] = {
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        "statement_cache_size": settings.db_statement_cache_size,
+    }
+    if settings.db_statement_timeout_ms:
+        args["server_settings"] = {"statement_timeout": str(settings.db_statement_timeout_ms)}
+    return args
+
+
+def _instrument(async_engine: AsyncEngine, slow_query_ms: float) -> None:
+    """Time every statement, attribute it to the current request and log statements over the slow threshold."""
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        conn.info["query_started"] = time.perf_counter()
+
+    @event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - conn.info.pop("query_started", time.perf_counter())
+        DB_QUERY_DURATION.observe(elapsed)
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+        if slow_query_ms > 0 and elapsed * 1000 >= slow_query_ms:
+            DB_SLOW_QUERIES.inc()
+            logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, normalize_sql(statement))
+
+
+def _build_engine(url: str | None = None) -> AsyncEngine:
+    """Create async SQLAlchemy engine from settings, for the primary or a given replica URL."""
     settings = get_settings()
-    return create_async_engine(settings.database_url, echo=False, future=True)
+    url = url or settings.database_url
+    async_engine = create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=_connect_args(settings, url),
+    )
+    _instrument(async_engine, settings.db_slow_query_ms)
+    return async_engine
+
+
+class ReplicaPool:
+    """Round-robin set of read replica engines with periodic health checks."""
+
+    def __init__(self, urls: list[str]) -> None:
+        self.urls = urls
+        self._engines: list[AsyncEngine] | None = None
+        self._healthy = [True] * len(urls)
+        self._counter = itertools.count()
+        self._health_task: asyncio.Task[None] | None = None
+
+    @property
+    def engines(self) -> list[AsyncEngine]:
+        """Replica engines, created on first use."""
+        if self._engines is None:
+            self._engines = [_build_engine(url) for url in self.urls]
+        return self._engines
+
+    def choose(self) -> AsyncEngine | None:
+        """Return the next healthy replica, or None so callers fall back to the primary."""
+        if not self.urls:
+            return None
+        for _ in range(len(self.engines)):
+            position = next(self._counter) % len(self.engines)
+            if self._healthy[position]:
+                return self.engines[position]
+        return None
+
+    async def check(self, timeout: float = 2.0) -> None:
+        """Probe every replica with SELECT 1 and record which ones answer."""
+        for position, replica in enumerate(self.engines):
+            try:
+                async with asyncio.timeout(timeout), replica.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            except Exception:
+                if self._healthy[position]:
+                    logger.warning("Read replica %s failed its health check", replica.url.render_as_string(hide_password=True))
+                self._healthy[position] = False
+            else:
+                self._healthy[position] = True
+
+    async def _run_health_checks(self, interval: float) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float) -> None:
+        """Start periodic health checks when replicas are configured."""
+        if self.urls and self._health_task is None:
+            self._health_task = asyncio.create_task(self._run_health_checks(interval))
+
+    async def close(self) -> None:
+        """Stop health checks and dispose replica engines."""
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        engines, self._engines = self._engines or [], None
+        for replica in engines:
+            await replica.dispose()
 
 
-engine: AsyncEngine = _build_engine()
-AsyncSessionFactory = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+class RoutingSession(Session):
+    """Session sending plain SELECTs to its replica and pinning to the primary after any write or lock."""
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Engine:
+        replica: AsyncEngine | None = self.info.get("replica")
+        if replica is None:
+            return get_engine().sync_engine
+        if self._flushing or not isinstance(clause, Select) or clause._for_update_arg is not None:
+            # Reads that follow a write in the same session must see it, so stay on the primary from now on.
+            self.info["replica"] = None
+            return get_engine().sync_engine
+        return replica.sync_engine
+
+
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+replicas = ReplicaPool(get_settings().read_urls)
+
+
+def get_engine() -> AsyncEngine:
+    """Return the primary engine, creating it on first use so importing the app loads no DB driver."""
+    global _engine
+    if _engine is None:
+        _engine = _build_engine()
+    return _engine
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory bound to the primary engine, creating both on first use."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(get_engine(), sync_session_class=RoutingSession, expire_on_commit=False, autoflush=False)
+    return _session_factory
+
+
+def new_session(**kwargs: Any) -> AsyncSession:
+    """Open a session from the lazily created factory."""
+    return get_session_factory()(**kwargs)
+
+
+async def dispose_engine() -> None:
+    """Close pooled connections of the primary engine, if it was ever created."""
+    if _engine is not None:
+        await _engine.dispose()
+
+
+def __getattr__(name: str) -> Any:
+    # `engine` and `AsyncSessionFactory` stay importable for scripts; resolving them creates the engine.
+    if name == "engine":
+        return get_engine()
+    if name == "AsyncSessionFactory":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _pool_gauge(read: Callable[[Any], int]) -> Callable[[], float]:
+    return lambda: read(_engine.pool) if _engine is not None else 0
+
+
+registry.gauge("db_pool_size", "Configured number of persistent pool connections.", _pool_gauge(lambda pool: pool.size()))
+registry.gauge("db_pool_checked_out", "Connections currently in use.", _pool_gauge(lambda pool: pool.checkedout()))
+registry.gauge("db_pool_checked_in", "Idle connections available in the pool.", _pool_gauge(lambda pool: pool.checkedin()))
+registry.gauge(
+    "db_pool_overflow", "Connections open beyond pool_size (negative while the pool warms up).", _pool_gauge(lambda pool: pool.overflow())
+)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide an async SQLAlchemy session dependency."""
-    async with AsyncSessionFactory() as session:
+    async with new_session() as session:
+        yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Provide a session whose reads go to a healthy replica, falling back to the primary."""
+    async with new_session(info={"replica": replicas.choose()}) as session:
         yield session
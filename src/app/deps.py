@@ -1,8 +1,9 @@
 from collections.abc import AsyncGenerator
+from contextlib import aclosing
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .db import get_session
+from .db import get_read_session, get_session
 from .settings import Settings, get_settings
 
 
@@ -13,5 +14,13 @@ def get_app_settings() -> Settings:
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency wrapper for database session."""
-    async for session in get_session():
-        yield session
+    async with aclosing(get_session()) as sessions:
+        async for session in sessions:
+            yield session
+
+
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency wrapper for a read-replica routed database session."""
+    async with aclosing(get_read_session()) as sessions:
+        async for session in sessions:
+            yield session
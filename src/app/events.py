@@ -0,0 +1,102 @@
+import asyncio
+import json
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from .metrics import registry
+from .settings import get_settings
+
+EVENTS_PUBLISHED = registry.counter("events_published", "Change events published to the in-process broker.", ("type",))
+EVENT_SUBSCRIBER_OVERFLOWS = registry.counter("event_subscriber_overflows", "Subscribers cut off because their buffer filled up.")
+
+
+class Event(NamedTuple):
+    id: int
+    type: str
+    mission_id: UUID
+    cat_id: UUID | None
+    data: dict[str, Any]
+
+    def encode(self) -> bytes:
+        """Render the event as a server-sent events frame."""
+        return f"id: {self.id}\nevent: {self.type}\ndata: {json.dumps(self.data, separators=(',', ':'))}\n\n".encode()
+
+
+class Subscription:
+    """Bounded buffer of events for one subscriber, filtered by mission and/or cat."""
+
+    def __init__(self, mission_id: UUID | None, cat_id: UUID | None, buffer_size: int) -> None:
+        self.mission_id = mission_id
+        self.cat_id = cat_id
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(buffer_size)
+        self.overflowed = False
+        self.missed_history = False
+
+    def matches(self, event: Event) -> bool:
+        return (self.mission_id is None or event.mission_id == self.mission_id) and (self.cat_id is None or event.cat_id == self.cat_id)
+
+    def offer(self, event: Event) -> None:
+        """Buffer an event without blocking the publisher; a full buffer cuts the subscriber off."""
+        if self.overflowed or not self.matches(event):
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            EVENT_SUBSCRIBER_OVERFLOWS.inc()
+
+
+class EventBroker:
+    """In-process fan-out of mission change events with a short replay history for reconnecting clients."""
+
+    def __init__(self, buffer_size: int = 100, history_size: int = 1000) -> None:
+        self.buffer_size = buffer_size
+        self._history: deque[Event] = deque(maxlen=history_size)
+        self._subscribers: set[Subscription] = set()
+        self._last_id = 0
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event_type: str, mission_id: UUID, cat_id: UUID | None = None, **data: Any) -> Event:
+        """Fan an event out to matching subscribers; never waits on slow consumers."""
+        payload = {"mission_id": str(mission_id), "cat_id": str(cat_id) if cat_id else None, **data}
+        self._last_id += 1
+        event = Event(self._last_id, event_type, mission_id, cat_id, payload)
+        self._history.append(event)
+        for subscription in list(self._subscribers):
+            subscription.offer(event)
+        EVENTS_PUBLISHED.inc(type=event_type)
+        return event
+
+    @contextmanager
+    def subscribe(
+        self, mission_id: UUID | None = None, cat_id: UUID | None = None, last_event_id: int | None = None
+    ) -> Iterator[Subscription]:
+        """Register a subscriber for the duration of the block, first replaying events after `last_event_id`."""
+        subscription = Subscription(mission_id, cat_id, self.buffer_size)
+        if last_event_id is not None:
+            oldest = self._history[0].id if self._history else self._last_id + 1
+            # Events after the client's last id are no longer retained (or ids restarted with the process): it must refetch state.
+            subscription.missed_history = last_event_id < oldest - 1 or last_event_id > self._last_id
+            for event in self._history:
+                if event.id > last_event_id:
+                    subscription.offer(event)
+        self._subscribers.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscribers.discard(subscription)
+
+
+def _build_broker() -> EventBroker:
+    settings = get_settings()
+    return EventBroker(settings.events_buffer_size, settings.events_history_size)
+
+
+broker = _build_broker()
+
+registry.gauge("event_subscribers", "Open change feed subscriptions.", lambda: len(broker))
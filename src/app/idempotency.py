@@ -0,0 +1,226 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Annotated, NamedTuple, Protocol
+
+from fastapi import Header, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql, sqlite
+
+from .db import get_engine, new_session
+from .jobs import job_queue
+from .metrics import registry
+from .models import IdempotencyKey
+from .settings import Settings, get_settings
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+PURGE_IDEMPOTENCY_KEYS = "purge_idempotency_keys"
+PENDING_POLL_SECONDS = 0.05
+PURGE_EVERY_CLAIMS = 500
+PENDING_LEASE = timedelta(seconds=60)
+
+IDEMPOTENT_REPLAYS = registry.counter("idempotent_replays", "Requests answered from a stored Idempotency-Key response.")
+
+
+class StoredResponse(NamedTuple):
+    fingerprint: str
+    status_code: int
+    body: bytes
+    media_type: str | None
+
+
+class IdempotencyStore(Protocol):
+    """Storage for first responses; claim() reserves a key so duplicates on other workers wait for the owner."""
+
+    async def get(self, key: str) -> StoredResponse | None: ...
+
+    async def claim(self, key: str, fingerprint: str) -> bool: ...
+
+    async def complete(self, key: str, response: StoredResponse) -> None: ...
+
+    async def release(self, key: str) -> None: ...
+
+
+class MemoryIdempotencyStore:
+    """Per-process LRU + TTL store; in-flight duplicates are coordinated by the IdempotencyManager."""
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 86_400) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, StoredResponse]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> StoredResponse | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        if item[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return item[1]
+
+    async def claim(self, key: str, fingerprint: str) -> bool:
+        return True
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def release(self, key: str) -> None:
+        return None
+
+
+class TableIdempotencyStore:
+    """Store in the idempotency_keys table, shared by all workers; a row without a status marks a request in flight."""
+
+    def __init__(self, ttl_seconds: float = 86_400) -> None:
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self._claims = 0
+
+    @staticmethod
+    def _aware(value: datetime) -> datetime:
+        # SQLite hands back naive datetimes; values are always written in UTC.
+        return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+    async def get(self, key: str) -> StoredResponse | None:
+        async with new_session() as session:
+            row = await session.get(IdempotencyKey, key)
+        if row is None or row.status_code is None or self._aware(row.expires_at) <= datetime.now(UTC):
+            return None
+        return StoredResponse(row.fingerprint, row.status_code, row.body or b"", row.media_type)
+
+    async def claim(self, key: str, fingerprint: str) -> bool:
+        now = datetime.now(UTC)
+        dialect_insert = postgresql.insert if get_engine().dialect.name == "postgresql" else sqlite.insert
+        async with new_session() as session:
+            await session.execute(delete(IdempotencyKey).where(IdempotencyKey.key == key, IdempotencyKey.expires_at <= now))
+            # A pending row only holds the key for a short lease, so a crashed owner does not block retries for the full TTL.
+            stmt = dialect_insert(IdempotencyKey).values(key=key, fingerprint=fingerprint, expires_at=now + PENDING_LEASE)
+            result = await session.execute(stmt.on_conflict_do_nothing(index_elements=["key"]))
+            await session.commit()
+        self._claims += 1
+        if self._claims % PURGE_EVERY_CLAIMS == 0:
+            job_queue.submit(PURGE_IDEMPOTENCY_KEYS)
+        return result.rowcount == 1
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        async with new_session() as session:
+            row = await session.get(IdempotencyKey, key)
+            if row is not None:
+                row.status_code, row.body, row.media_type = response.status_code, response.body, response.media_type
+                row.expires_at = datetime.now(UTC) + self.ttl
+                await session.commit()
+
+    async def release(self, key: str) -> None:
+        async with new_session() as session:
+            await session.execute(delete(IdempotencyKey).where(IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None)))
+            await session.commit()
+
+
+@job_queue.handler(PURGE_IDEMPOTENCY_KEYS)
+async def purge_idempotency_keys() -> None:
+    """Delete expired idempotency rows."""
+    async with new_session() as session:
+        await session.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.now(UTC)))
+        await session.commit()
+
+
+def _replay(stored: StoredResponse, fingerprint: str) -> Response:
+    if stored.fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{IDEMPOTENCY_KEY_HEADER} was already used for a different request",
+        )
+    IDEMPOTENT_REPLAYS.inc()
+    return Response(stored.body, stored.status_code, headers={REPLAYED_HEADER: "true"}, media_type=stored.media_type)
+
+
+class IdempotencyManager:
+    """Answers repeated requests from the store and makes concurrent duplicates wait for the first one."""
+
+    def __init__(self, store: IdempotencyStore, wait_seconds: float = 10.0) -> None:
+        self.store = store
+        self.wait_seconds = wait_seconds
+        self._in_flight: dict[str, asyncio.Future[None]] = {}
+
+    async def run(self, key: str, fingerprint: str, handler: Callable[[], Awaitable[Response]]) -> Response:
+        """Return the stored response for `key`, or run `handler` once and store its response."""
+        # Same key already running in this process: wait for it, then replay its response (or run if it failed).
+        while (in_flight := self._in_flight.get(key)) is not None:
+            await asyncio.shield(in_flight)
+        done = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = done
+        try:
+            stored = await self.store.get(key)
+            if stored is not None:
+                return _replay(stored, fingerprint)
+            if not await self.store.claim(key, fingerprint):
+                return await self._wait_for_other_worker(key, fingerprint)
+            try:
+                response = await handler()
+            except HTTPException as exc:
+                response = JSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+            except BaseException:
+                await self.store.release(key)
+                raise
+            if response.status_code >= 500:
+                await self.store.release(key)
+            else:
+                await self.store.complete(key, StoredResponse(fingerprint, response.status_code, bytes(response.body), response.media_type))
+            return response
+        finally:
+            del self._in_flight[key]
+            done.set_result(None)
+
+    async def _wait_for_other_worker(self, key: str, fingerprint: str) -> Response:
+        deadline = time.monotonic() + self.wait_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(PENDING_POLL_SECONDS)
+            stored = await self.store.get(key)
+            if stored is not None:
+                return _replay(stored, fingerprint)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A request with this {IDEMPOTENCY_KEY_HEADER} is still in progress",
+        )
+
+
+def _build_store(settings: Settings) -> IdempotencyStore:
+    if settings.idempotency_backend == "table":
+        return TableIdempotencyStore(settings.idempotency_ttl_seconds)
+    return MemoryIdempotencyStore(settings.idempotency_max_entries, settings.idempotency_ttl_seconds)
+
+
+def _build_manager() -> IdempotencyManager:
+    settings = get_settings()
+    return IdempotencyManager(_build_store(settings), settings.idempotency_wait_seconds)
+
+
+idempotency = _build_manager()
+
+
+def request_fingerprint(scope: str, body: bytes) -> str:
+    """Hash of the endpoint and payload, used to reject a key reused for a different request."""
+    return hashlib.sha256(scope.encode() + b"\0" + body).hexdigest()
+
+
+IdempotencyKeyHeader = Annotated[str | None, Header(alias=IDEMPOTENCY_KEY_HEADER, min_length=1, max_length=255)]
+
+
+async def idempotent(key: str | None, request: Request, payload: BaseModel, handler: Callable[[], Awaitable[Response]]) -> Response:
+    """Run `handler` once per Idempotency-Key for this endpoint; without a key it simply runs."""
+    if key is None:
+        return await handler()
+    scope = f"{request.method} {request.url.path}"
+    return await idempotency.run(f"{scope} {key}", request_fingerprint(scope, payload.model_dump_json().encode()), handler)
@@ -0,0 +1,89 @@
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import registry
+
+QUERY_BUCKETS = (0.0, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 21.0, 34.0, 55.0, 100.0)
+
+REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "Time from request start to response start, per route.", ("method", "route", "status")
+)
+REQUEST_DB_SECONDS = registry.histogram("http_request_db_seconds", "Time spent executing SQL per request, per route.", ("method", "route"))
+REQUEST_QUERIES = registry.histogram(
+    "http_request_db_queries", "SQL statements executed per request, per route.", ("method", "route"), buckets=QUERY_BUCKETS
+)
+DB_QUERY_DURATION = registry.histogram("db_query_duration_seconds", "Duration of individual SQL statements.")
+DB_SLOW_QUERIES = registry.counter("db_slow_queries", "SQL statements slower than DB_SLOW_QUERY_MS.")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse literals, bind placeholders and IN/VALUES lists so equivalent statements log identically."""
+    normalized = _PLACEHOLDER.sub("?", _STRING_LITERAL.sub("?", statement))
+    return _VALUE_LIST.sub("(?, ...)", _WHITESPACE.sub(" ", normalized)).strip()
+
+
+@dataclass
+class RequestStats:
+    """SQL and serialization cost accumulated while handling one request."""
+
+    queries: int = 0
+    db_seconds: float = 0.0
+    serialize_seconds: float = 0.0
+
+
+current_request_stats: ContextVar[RequestStats | None] = ContextVar("current_request_stats", default=None)
+
+
+def record_serialization(seconds: float) -> None:
+    """Attribute response encoding time to the current request, if any."""
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.serialize_seconds += seconds
+
+
+def _server_timing(stats: RequestStats, total: float) -> str:
+    return (
+        f'db;dur={stats.db_seconds * 1000:.3f};desc="{stats.queries} queries", '
+        f"serialize;dur={stats.serialize_seconds * 1000:.3f}, total;dur={total * 1000:.3f}"
+    )
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware adding Server-Timing headers and per-route latency, SQL time and query count histograms."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - started
+                route = scope.get("route")
+                labels = {"method": scope["method"], "route": getattr(route, "path", "unmatched")}
+                REQUEST_DURATION.observe(elapsed, status=str(message["status"]), **labels)
+                REQUEST_DB_SECONDS.observe(stats.db_seconds, **labels)
+                REQUEST_QUERIES.observe(stats.queries, **labels)
+                MutableHeaders(scope=message).append("Server-Timing", _server_timing(stats, elapsed))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request_stats.reset(token)
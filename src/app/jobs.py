@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .metrics import registry
+from .settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+JOBS_SUBMITTED = registry.counter("jobs_submitted", "Background jobs accepted by the queue.", ("job",))
+JOBS_COMPLETED = registry.counter("jobs_completed", "Background jobs that finished successfully.", ("job",))
+JOBS_RETRIED = registry.counter("jobs_retried", "Background job attempts that failed and were rescheduled.", ("job",))
+JOBS_FAILED = registry.counter("jobs_failed", "Background jobs that failed on their last attempt.", ("job",))
+JOBS_DROPPED = registry.counter("jobs_dropped", "Background jobs rejected because the queue was full or draining.", ("job",))
+
+JobHandler = Callable[..., Awaitable[None]]
+
+AUDIT_EVENT = "record_audit_event"
+WARM_RESPONSE_CACHE = "warm_response_cache"
+WARM_BREEDS = "warm_breeds"
+
+
+@dataclass
+class Job:
+    name: str
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+
+
+class JobQueue:
+    """Bounded in-process queue of named async jobs run by a fixed number of workers, with retries and drain."""
+
+    def __init__(self, max_size: int = 1000, concurrency: int = 4, max_attempts: int = 3, backoff_seconds: float = 0.5) -> None:
+        self.max_size = max_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.handlers: dict[str, JobHandler] = {}
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(max_size)
+        self._workers: list[asyncio.Task[None]] = []
+        self._retries: set[asyncio.Task[None]] = set()
+        self._unfinished = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._accepting = True
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    def handler(self, name: str) -> Callable[[JobHandler], JobHandler]:
+        """Register the coroutine function run for jobs submitted under `name`."""
+
+        def register(func: JobHandler) -> JobHandler:
+            self.handlers[name] = func
+            return func
+
+        return register
+
+    def submit(self, name: str, *args: Any, **kwargs: Any) -> bool:
+        """Enqueue a job without waiting; returns False when it was dropped because the queue is full or draining."""
+        if not self._accepting or name not in self.handlers:
+            if name not in self.handlers:
+                logger.error("No handler registered for background job %s", name)
+            JOBS_DROPPED.inc(job=name)
+            return False
+        try:
+            self._queue.put_nowait(Job(name, args, kwargs))
+        except asyncio.QueueFull:
+            logger.warning("Background job queue full, dropping %s", name)
+            JOBS_DROPPED.inc(job=name)
+            return False
+        self._track(1)
+        JOBS_SUBMITTED.inc(job=name)
+        return True
+
+    def start(self) -> None:
+        """Start the workers; jobs submitted earlier are picked up now."""
+        self._accepting = True
+        if not self._workers:
+            # Rebind to the running loop so the app can be started again, e.g. once per test.
+            pending = [self._queue.get_nowait() for _ in range(self._queue.qsize())]
+            self._queue = asyncio.Queue(self.max_size)
+            for job in pending:
+                self._queue.put_nowait(job)
+            self._idle = asyncio.Event()
+            self._track(0)
+        while len(self._workers) < self.concurrency:
+            self._workers.append(asyncio.create_task(self._work()))
+
+    async def join(self) -> None:
+        """Wait until every submitted job, including scheduled retries, has finished."""
+        await self._idle.wait()
+
+    async def drain(self, timeout: float) -> None:
+        """Stop accepting jobs, give queued work up to `timeout` seconds to finish, then stop the workers."""
+        self._accepting = False
+        try:
+            async with asyncio.timeout(timeout):
+                await self.join()
+        except TimeoutError:
+            logger.warning("Background job queue drain timed out with %d jobs unfinished", self._unfinished)
+        tasks = [*self._workers, *self._retries]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers.clear()
+        self._retries.clear()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._track(-self._unfinished)
+
+    def _track(self, delta: int) -> None:
+        self._unfinished += delta
+        if self._unfinished:
+            self._idle.clear()
+        else:
+            self._idle.set()
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            await self._run(job)
+
+    async def _run(self, job: Job) -> None:
+        job.attempts += 1
+        try:
+            await self.handlers[job.name](*job.args, **job.kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if job.attempts < self.max_attempts:
+                JOBS_RETRIED.inc(job=job.name)
+                delay = self.backoff_seconds * 2 ** (job.attempts - 1) * random.uniform(0.5, 1.0)
+                logger.warning("Background job %s failed (attempt %d), retrying in %.2fs", job.name, job.attempts, delay, exc_info=True)
+                retry = asyncio.create_task(self._retry_later(job, delay))
+                self._retries.add(retry)
+                retry.add_done_callback(self._retries.discard)
+                return
+            JOBS_FAILED.inc(job=job.name)
+            logger.exception("Background job %s failed after %d attempts", job.name, job.attempts)
+        else:
+            JOBS_COMPLETED.inc(job=job.name)
+        self._track(-1)
+
+    async def _retry_later(self, job: Job, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._queue.put(job)
+
+
+def _build_job_queue() -> JobQueue:
+    settings = get_settings()
+    return JobQueue(settings.job_queue_max_size, settings.job_workers, settings.job_max_attempts, settings.job_retry_backoff_seconds)
+
+
+job_queue = _build_job_queue()
+
+registry.gauge("jobs_queued", "Background jobs waiting for a worker.", lambda: len(job_queue))
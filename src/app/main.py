@@ -1,20 +1,39 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from . import tasks  # noqa: F401  (registers background job handlers)
+from .admission import AdmissionControlMiddleware
 from .api import cats as cats_router
+from .api import events as events_router
 from .api import missions as missions_router
-from .db import Base, engine
+from .api import stats as stats_router
+from .api import targets as targets_router
+from .clients.cat_api import close_http_client, get_http_client
+from .db import dispose_engine, replicas
 from .deps import get_app_settings
+from .instrumentation import RequestMetricsMiddleware
+from .jobs import job_queue
+from .metrics import PROMETHEUS_CONTENT_TYPE, registry
+from .readiness import readiness
 from .settings import Settings
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize application resources and teardown on shutdown."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    settings = get_app_settings()
+    job_queue.start()
+    get_http_client()
+    readiness.start(settings)
+    replicas.start(settings.db_replica_health_interval_seconds)
     yield
+    await readiness.stop()
+    await job_queue.drain(settings.job_drain_timeout_seconds)
+    await replicas.close()
+    await close_http_client()
+    await dispose_engine()
 
 
 def create_app(settings: Settings | None = None) -> FastAPI:
@@ -26,13 +45,29 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         lifespan=lifespan,
     )
 
+    application.add_middleware(RequestMetricsMiddleware)
+    # Added last so it runs first: rejected requests cost no routing, DB or metrics work.
+    application.add_middleware(AdmissionControlMiddleware, settings=current_settings)
     application.include_router(cats_router.router)
     application.include_router(missions_router.router)
+    application.include_router(stats_router.router)
+    application.include_router(targets_router.router)
+    application.include_router(events_router.router)
 
     @application.get("/health")
     async def health() -> dict[str, str]:
         return {"status": "ok", "env": "dev", "port": str(current_settings.app_port)}
 
+    @application.get("/ready")
+    async def ready() -> JSONResponse:
+        """Readiness probe: 503 until the DB pool (and breed cache, if required) is warm, and again while shutting down."""
+        status_code = status.HTTP_200_OK if readiness.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        return JSONResponse(readiness.report(), status_code=status_code)
+
+    @application.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
     return application
 
 
@@ -2,12 +2,15 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, String, func
+from sqlalchemy import JSON, BigInteger, Boolean, DateTime, ForeignKey, Index, Integer, LargeBinary, Numeric, String, func, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .db import Base
 
+ACTIVE_CAT_INDEX = "uq_missions_active_cat"
+OPEN_MISSION = text("complete IS false")
+
 
 class Cat(Base):
     __tablename__ = "cats"
@@ -26,10 +29,18 @@ class Mission(Base):
     __tablename__ = "missions"
     """Mission entity containing targets and optional assigned cat."""
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    assigned_cat_id: Mapped[UUID | None] = mapped_column(
-        PGUUID(as_uuid=True), ForeignKey("cats.id", ondelete="SET NULL"), nullable=True, index=True
+    __table_args__ = (
+        # A cat may hold at most one incomplete mission; enforced by the database to stay race-free. The predicate is
+        # spelled like the services' `complete IS false` filters so the planner can use it for the busy-cat check.
+        Index(ACTIVE_CAT_INDEX, "assigned_cat_id", unique=True, postgresql_where=OPEN_MISSION, sqlite_where=OPEN_MISSION),
+        # Keyset listing in (created_at, id) order, overall, per assigned cat and for open missions only.
+        Index("ix_missions_created_at_id", "created_at", "id"),
+        Index("ix_missions_assigned_cat_id_created_at", "assigned_cat_id", "created_at", "id"),
+        Index("ix_missions_open_created_at", "created_at", "id", postgresql_where=OPEN_MISSION, sqlite_where=OPEN_MISSION),
     )
+
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    assigned_cat_id: Mapped[UUID | None] = mapped_column(PGUUID(as_uuid=True), ForeignKey("cats.id", ondelete="SET NULL"), nullable=True)
     complete: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
@@ -42,10 +53,72 @@ class Target(Base):
     """Target entity belonging to a mission."""
 
     id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    mission_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("missions.id", ondelete="CASCADE"), nullable=False)
+    mission_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("missions.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     name: Mapped[str] = mapped_column(String(150), nullable=False)
     country: Mapped[str] = mapped_column(String(80), nullable=False)
     notes: Mapped[str] = mapped_column(String, nullable=False, default="")
     complete: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     mission: Mapped[Mission] = relationship("Mission", back_populates="targets")
+
+
+class StatCounter(Base):
+    __tablename__ = "stat_counters"
+    """Named global counter maintained incrementally by the write paths."""
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class BreedStats(Base):
+    __tablename__ = "breed_stats"
+    """Cat headcount and payroll per breed."""
+
+    breed: Mapped[str] = mapped_column(String(100), primary_key=True)
+    cats: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    salary_total: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+
+
+class CountryStats(Base):
+    __tablename__ = "country_stats"
+    """Target totals per country."""
+
+    country: Mapped[str] = mapped_column(String(80), primary_key=True)
+    targets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    targets_completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class CatStats(Base):
+    __tablename__ = "cat_stats"
+    """Missions assigned to and completed by each cat."""
+
+    __table_args__ = (Index("ix_cat_stats_missions_assigned", "missions_assigned", "cat_id"),)
+
+    cat_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("cats.id", ondelete="CASCADE"), primary_key=True)
+    missions_assigned: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    missions_completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class AuditEvent(Base):
+    __tablename__ = "audit_events"
+    """Record of a write, stored by a background job after the request has committed."""
+
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    action: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[UUID | None] = mapped_column(PGUUID(as_uuid=True), nullable=True, index=True)
+    details: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+    """First response stored for an Idempotency-Key; a NULL status marks a request still in flight."""
+
+    key: Mapped[str] = mapped_column(String(300), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    body: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    media_type: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import text
+
+from .clients.cat_api import get_breeds, load_breed_snapshot
+from .db import get_engine
+from .jobs import WARM_BREEDS, job_queue
+from .metrics import registry
+from .settings import Settings
+
+logger = logging.getLogger(__name__)
+
+DATABASE = "database"
+BREEDS = "breeds"
+RETRY_INITIAL_SECONDS = 0.5
+RETRY_MAX_SECONDS = 10.0
+
+
+class Readiness:
+    """Startup warm-up run in the background; the worker reports ready once every required step has finished."""
+
+    def __init__(self) -> None:
+        self.checks: dict[str, bool] = {}
+        self.started_at: float | None = None
+        self.ready_seconds: float | None = None
+        self.stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.started_at is not None and not self.stopping and all(self.checks.values())
+
+    def start(self, settings: Settings) -> None:
+        """Begin warming the DB pool and breed cache without delaying the server from accepting connections."""
+        self.started_at = time.perf_counter()
+        self.ready_seconds = None
+        self.stopping = False
+        self.checks = {DATABASE: False}
+        if settings.startup_warm_breeds:
+            self.checks[BREEDS] = False
+        self._task = asyncio.create_task(self._warm_up(settings))
+
+    async def stop(self) -> None:
+        """Report not ready so load balancers stop routing here, and cancel unfinished warm-up."""
+        self.stopping = True
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def report(self) -> dict[str, Any]:
+        status = "ready" if self.ready else "stopping" if self.stopping else "starting"
+        startup_ms = round(self.ready_seconds * 1000, 1) if self.ready_seconds is not None else None
+        return {"status": status, "checks": dict(self.checks), "startup_ms": startup_ms}
+
+    def _mark(self, name: str) -> None:
+        self.checks[name] = True
+        if self.ready and self.ready_seconds is None and self.started_at is not None:
+            self.ready_seconds = time.perf_counter() - self.started_at
+            logger.info("Worker ready %.0f ms after startup", self.ready_seconds * 1000)
+
+    async def _warm_up(self, settings: Settings) -> None:
+        connections = min(settings.startup_warm_db_connections, settings.db_pool_size)
+        await asyncio.gather(self._warm_database(connections), self._warm_breeds(settings.startup_warm_breeds))
+
+    async def _warm_database(self, connections: int) -> None:
+        if connections > 0:
+            await _retry("Database warm-up", lambda: asyncio.gather(*(_ping() for _ in range(connections))))
+        self._mark(DATABASE)
+
+    async def _warm_breeds(self, required: bool) -> None:
+        if await load_breed_snapshot():
+            if required:
+                self._mark(BREEDS)
+        elif required:
+            await _retry("Breed warm-up", get_breeds)
+            self._mark(BREEDS)
+        else:
+            job_queue.submit(WARM_BREEDS)
+
+
+async def _ping() -> None:
+    """Open a pooled connection and run SELECT 1; the connection stays in the pool for the first requests."""
+    async with get_engine().connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _retry(step: str, operation: Callable[[], Awaitable[Any]]) -> None:
+    delay = RETRY_INITIAL_SECONDS
+    while True:
+        try:
+            await operation()
+            return
+        except Exception:
+            logger.warning("%s failed, retrying in %.1f s", step, delay, exc_info=True)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RETRY_MAX_SECONDS)
+
+
+readiness = Readiness()
+
+registry.gauge("worker_ready", "1 once startup warm-up has finished and the worker accepts traffic.", lambda: float(readiness.ready))
+registry.gauge("worker_startup_seconds", "Time from lifespan start until the worker became ready.", lambda: readiness.ready_seconds or 0.0)
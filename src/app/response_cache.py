@@ -0,0 +1,109 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import NamedTuple
+
+from fastapi import Request, Response, status
+
+from .metrics import registry
+from .settings import get_settings
+
+CACHE_HITS = registry.counter("response_cache_hits", "Entity responses served from the in-process cache.", ("kind",))
+CACHE_MISSES = registry.counter("response_cache_misses", "Entity responses rendered because no fresh cache entry existed.", ("kind",))
+CACHE_EVICTIONS = registry.counter("response_cache_evictions", "Cache entries dropped to respect size limits.", ("kind",))
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class ResponseCache:
+    """LRU + TTL cache of serialized entity responses bounded by entry count and total bytes."""
+
+    def __init__(self, max_entries: int = 10_000, max_bytes: int = 64 * 1024 * 1024, ttl_seconds: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl_seconds
+        self.size_bytes = 0
+        self._entries: OrderedDict[tuple[str, Hashable], CachedResponse] = OrderedDict()
+        self._generation = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self) -> int:
+        """Return a token that changes on every invalidation; pass it back to put()."""
+        return self._generation
+
+    def get(self, kind: str, key: Hashable) -> CachedResponse | None:
+        """Return a fresh entry and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._entries.move_to_end((kind, key))
+                CACHE_HITS.inc(kind=kind)
+                return entry
+            if entry is not None:
+                self._drop((kind, key))
+        CACHE_MISSES.inc(kind=kind)
+        return None
+
+    def put(self, kind: str, key: Hashable, body: bytes, generation: int) -> CachedResponse:
+        """Store a rendered body unless an invalidation happened since `generation` was read."""
+        entry = CachedResponse(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"', time.monotonic() + self.ttl)
+        if len(body) > self.max_bytes:
+            return entry
+        with self._lock:
+            if generation != self._generation:
+                return entry
+            self._drop((kind, key))
+            self._entries[(kind, key)] = entry
+            self.size_bytes += len(body)
+            while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+                evicted_key, _ = next(iter(self._entries.items()))
+                self._drop(evicted_key)
+                CACHE_EVICTIONS.inc(kind=evicted_key[0])
+        return entry
+
+    def invalidate(self, kind: str, *keys: Hashable) -> None:
+        """Drop entries changed by a write so the next read renders fresh data."""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._drop((kind, key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def _drop(self, cache_key: tuple[str, Hashable]) -> None:
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self.size_bytes -= len(entry.body)
+
+
+def _build_response_cache() -> ResponseCache:
+    settings = get_settings()
+    return ResponseCache(settings.response_cache_max_entries, settings.response_cache_max_bytes, settings.response_cache_ttl_seconds)
+
+
+response_cache = _build_response_cache()
+
+registry.gauge("response_cache_entries", "Entries currently held by the response cache.", lambda: len(response_cache))
+registry.gauge("response_cache_bytes", "Serialized bytes currently held by the response cache.", lambda: response_cache.size_bytes)
+
+
+def cached_json_response(entry: CachedResponse, request: Request) -> Response:
+    """Return 304 when the client already holds this ETag, otherwise the cached JSON body."""
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or entry.etag in {tag.strip() for tag in if_none_match.split(",")}):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
+MAX_BULK_ITEMS = 10_000
+
 
 def _quantize_salary(value: Decimal) -> Decimal:
     return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
@@ -25,7 +27,7 @@ class CatBase(BaseModel):
 
     @field_serializer("salary")
     def serialize_salary(self, value: Decimal) -> str:
-        return format(_quantize_salary(value), ".2f")
+        return format(value, ".2f")
 
 
 class CatCreate(CatBase):
@@ -47,7 +49,8 @@ class CatRead(BaseModel):
 
     @field_serializer("salary")
     def serialize_salary(self, value: Decimal) -> str:
-        return format(_quantize_salary(value), ".2f")
+        # NUMERIC(10, 2) columns already carry exactly two decimal places.
+        return format(value, ".2f")
 
 
 class CatUpdateSalary(BaseModel):
@@ -64,4 +67,22 @@ class CatUpdateSalary(BaseModel):
 
     @field_serializer("salary")
     def serialize_salary(self, value: Decimal) -> str:
-        return format(_quantize_salary(value), ".2f")
+        return format(value, ".2f")
+
+
+class CatBulkCreate(BaseModel):
+    """Payload for creating many cats in one request."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    items: list[CatCreate] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class CatBulkResult(BaseModel):
+    """Per-item outcome of a bulk cat creation."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    index: int
+    cat: CatRead | None = None
+    error: str | None = None
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from .cats import MAX_BULK_ITEMS
+
 
 class TargetCreate(BaseModel):
     """Payload for creating a mission target."""
@@ -24,6 +26,27 @@ class TargetUpdate(BaseModel):
     complete: bool | None = None
 
 
+class TargetBatchItem(TargetUpdate):
+    """Update for one target of a batch, addressed by target id."""
+
+    id: UUID
+
+
+class TargetBatchUpdate(BaseModel):
+    """Payload for updating several targets of one mission in one transaction."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    items: list[TargetBatchItem] = Field(min_length=1, max_length=3)
+
+    @field_validator("items")
+    @classmethod
+    def validate_unique_targets(cls, value: list[TargetBatchItem]) -> list[TargetBatchItem]:
+        if len({item.id for item in value}) != len(value):
+            raise ValueError("Each target may appear only once")
+        return value
+
+
 class TargetRead(BaseModel):
     """Target representation for responses."""
 
@@ -36,6 +59,14 @@ class TargetRead(BaseModel):
     complete: bool
 
 
+class TargetSearchHit(TargetRead):
+    """Target matched by full-text search, with its mission and relevance rank."""
+
+    mission_id: UUID
+    mission_complete: bool
+    rank: float
+
+
 class MissionCreate(BaseModel):
     """Payload for creating a mission with targets."""
 
@@ -69,3 +100,21 @@ class MissionRead(BaseModel):
     complete: bool
     created_at: datetime
     targets: list[TargetRead]
+
+
+class MissionBulkCreate(BaseModel):
+    """Payload for creating many missions in one request."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    items: list[MissionCreate] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class MissionBulkResult(BaseModel):
+    """Per-item outcome of a bulk mission creation."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    index: int
+    mission: MissionRead | None = None
+    error: str | None = None
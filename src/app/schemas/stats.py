@@ -0,0 +1,87 @@
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, field_serializer
+
+
+class BreedPayroll(BaseModel):
+    """Headcount and payroll for one breed."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    breed: str
+    cats: int
+    salary_total: Decimal
+    salary_avg: Decimal
+
+    @field_serializer("salary_total", "salary_avg")
+    def serialize_money(self, value: Decimal) -> str:
+        return format(value, ".2f")
+
+
+class PayrollStats(BaseModel):
+    """Agency-wide payroll with a per-breed breakdown."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    cats: int
+    salary_total: Decimal
+    salary_avg: Decimal
+    by_breed: list[BreedPayroll]
+
+    @field_serializer("salary_total", "salary_avg")
+    def serialize_money(self, value: Decimal) -> str:
+        return format(value, ".2f")
+
+
+class MissionStats(BaseModel):
+    """Active vs. completed missions."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    active: int
+    completed: int
+    total: int
+    completion_rate: float
+
+
+class CatMissionStats(BaseModel):
+    """Mission counts for one cat."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    cat_id: UUID
+    missions_assigned: int
+    missions_completed: int
+    active: bool
+
+
+class CatUtilizationStats(BaseModel):
+    """Share of cats on an active mission plus the cats with the most missions."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    cats: int
+    busy: int
+    utilization: float
+    top: list[CatMissionStats]
+
+
+class CountryTargets(BaseModel):
+    """Target totals for one country."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    country: str
+    targets: int
+    targets_completed: int
+
+
+class TargetStats(BaseModel):
+    """Target totals with a per-country breakdown."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    targets: int
+    targets_completed: int
+    by_country: list[CountryTargets]
@@ -0,0 +1,141 @@
+import asyncio
+import heapq
+import re
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import Mission, Target
+
+# Field weights mirroring the tsvector setweight() classes: name A, country B, notes C.
+FIELD_WEIGHTS = {"name": 1.0, "country": 0.4, "notes": 0.2}
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.casefold())
+
+
+@dataclass
+class TargetDoc:
+    id: UUID
+    mission_id: UUID
+    name: str
+    country: str
+    notes: str
+    complete: bool
+    mission_complete: bool
+    weights: dict[str, float]
+
+
+class TargetSearchIndex:
+    """In-process inverted index over target name, country and notes, used when the database has no full-text search.
+
+    Built lazily from the database on first search and kept current by the mission write paths in this process.
+    """
+
+    def __init__(self) -> None:
+        self._docs: dict[UUID, TargetDoc] = {}
+        self._postings: dict[str, set[UUID]] = {}
+        self._by_mission: dict[UUID, set[UUID]] = {}
+        self._built = False
+        self._pending: list[Callable[[], None]] | None = None
+        self._lock = asyncio.Lock()
+
+    async def ensure_built(self, session: AsyncSession) -> None:
+        if self._built:
+            return
+        async with self._lock:
+            if self._built:
+                return
+            # Writes committed while the snapshot loads are queued and replayed on top of it.
+            self._pending = []
+            stmt = select(Target.id, Target.mission_id, Target.name, Target.country, Target.notes, Target.complete, Mission.complete).join(
+                Mission, Mission.id == Target.mission_id
+            )
+            try:
+                for row in (await session.execute(stmt)).tuples():
+                    self._upsert(*row)
+                for operation in self._pending:
+                    operation()
+            finally:
+                self._pending = None
+            self._built = True
+
+    def _apply(self, operation: Callable[[], None]) -> None:
+        if self._pending is not None:
+            self._pending.append(operation)
+        elif self._built:
+            operation()
+
+    def upsert(self, target: Any, mission_complete: bool) -> None:
+        """Index a created or edited target."""
+        values = (target.id, target.mission_id, target.name, target.country, target.notes, target.complete, mission_complete)
+        self._apply(lambda: self._upsert(*values))
+
+    def mission_completed(self, mission_id: UUID) -> None:
+        self._apply(lambda: self._mark_complete(mission_id))
+
+    def mission_removed(self, mission_id: UUID) -> None:
+        self._apply(lambda: self._remove_mission(mission_id))
+
+    def _upsert(
+        self, target_id: UUID, mission_id: UUID, name: str, country: str, notes: str, complete: bool, mission_complete: bool
+    ) -> None:
+        self._remove(target_id)
+        weights: Counter[str] = Counter()
+        for field, text in (("name", name), ("country", country), ("notes", notes)):
+            for token in tokenize(text):
+                weights[token] += FIELD_WEIGHTS[field]
+        self._docs[target_id] = TargetDoc(target_id, mission_id, name, country, notes, complete, mission_complete, dict(weights))
+        self._by_mission.setdefault(mission_id, set()).add(target_id)
+        for token in weights:
+            self._postings.setdefault(token, set()).add(target_id)
+
+    def _remove(self, target_id: UUID) -> None:
+        doc = self._docs.pop(target_id, None)
+        if doc is None:
+            return
+        self._by_mission.get(doc.mission_id, set()).discard(target_id)
+        for token in doc.weights:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(target_id)
+                if not postings:
+                    del self._postings[token]
+
+    def _mark_complete(self, mission_id: UUID) -> None:
+        for target_id in self._by_mission.get(mission_id, ()):
+            self._docs[target_id].mission_complete = True
+
+    def _remove_mission(self, mission_id: UUID) -> None:
+        for target_id in list(self._by_mission.pop(mission_id, ())):
+            self._remove(target_id)
+
+    def search(
+        self, query: str, limit: int, after: tuple[float, UUID] | None = None, mission_complete: bool | None = None
+    ) -> list[tuple[TargetDoc, float]]:
+        """Return up to `limit` targets containing every query term, ranked by weighted term frequency."""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        postings = sorted((self._postings.get(term, set()) for term in terms), key=len)
+        candidates = set.intersection(*postings)
+        hits: list[tuple[TargetDoc, float]] = []
+        for target_id in candidates:
+            doc = self._docs[target_id]
+            if mission_complete is not None and doc.mission_complete != mission_complete:
+                continue
+            rank = round(sum(doc.weights[term] for term in terms), 6)
+            if after is not None and not (rank < after[0] or (rank == after[0] and target_id > after[1])):
+                continue
+            hits.append((doc, rank))
+        return heapq.nsmallest(limit, hits, key=lambda hit: (-hit[1], hit[0].id))
+
+
+target_search_index = TargetSearchIndex()
@@ -1,12 +1,28 @@
-from uuid import UUID
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..clients.cat_api import validate_breed
+from ..clients.cat_api import BreedIndex, get_breed_index
+from ..jobs import AUDIT_EVENT, WARM_RESPONSE_CACHE, job_queue
 from ..models import Cat, Mission
-from ..schemas.cats import CatCreate, CatUpdateSalary
+from ..pagination import DEFAULT_PAGE_SIZE, EXPORT_BATCH_SIZE, decode_cursor, encode_cursor
+from ..response_cache import response_cache
+from ..schemas.cats import CatBulkCreate, CatBulkResult, CatCreate, CatRead, CatUpdateSalary
+from .stats_service import StatsService
+
+INVALID_BREED_DETAIL = "Breed is not valid according to TheCatAPI"
+CAT_COLUMNS = (Cat.id, Cat.name, Cat.years_experience, Cat.breed, Cat.salary)
+
+
+def _invalid_breed_detail(breeds: BreedIndex, breed: str) -> str:
+    suggestions = breeds.suggest(breed)
+    if not suggestions:
+        return INVALID_BREED_DETAIL
+    return f"{INVALID_BREED_DETAIL}; did you mean: {', '.join(suggestions)}?"
 
 
 class CatService:
@@ -14,33 +30,91 @@ class CatService:
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self.stats = StatsService(session)
 
     async def create_cat(self, payload: CatCreate) -> Cat:
-        """Create a cat after validating breed via TheCatAPI."""
-        is_valid = await validate_breed(payload.breed)
-        if not is_valid:
+        """Create a cat after validating breed via TheCatAPI, storing the canonical breed spelling."""
+        breeds = await get_breed_index()
+        breed = breeds.canonical(payload.breed)
+        if breed is None:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Breed is not valid according to TheCatAPI",
+                detail=_invalid_breed_detail(breeds, payload.breed),
             )
-        cat = Cat(
-            name=payload.name,
-            years_experience=payload.years_experience,
-            breed=payload.breed,
-            salary=payload.salary,
-        )
-        self.session.add(cat)
+        (cat,) = await self._insert_cats([payload.model_copy(update={"breed": breed})])
         await self.session.commit()
-        await self.session.refresh(cat)
+        job_queue.submit(AUDIT_EVENT, "cat.created", cat.id)
         return cat
 
-    async def list_cats(self) -> list[Cat]:
-        """Return all cats."""
-        result = await self.session.execute(select(Cat))
-        return list(result.scalars().all())
+    async def bulk_create_cats(self, payload: CatBulkCreate) -> list[CatBulkResult]:
+        """Create many cats in one transaction, validating breeds against a single breed index."""
+        breeds = await get_breed_index()
+        results: list[CatBulkResult] = []
+        valid: list[tuple[int, CatCreate]] = []
+        for index, item in enumerate(payload.items):
+            breed = breeds.canonical(item.breed)
+            if breed is None:
+                results.append(CatBulkResult(index=index, error=_invalid_breed_detail(breeds, item.breed)))
+            else:
+                results.append(CatBulkResult(index=index))
+                valid.append((index, item.model_copy(update={"breed": breed})))
+        if valid:
+            cats = await self._insert_cats([item for _, item in valid])
+            await self.session.commit()
+            job_queue.submit(AUDIT_EVENT, "cat.bulk_created", None, {"ids": [str(cat.id) for cat in cats]})
+            for (index, _), cat in zip(valid, cats, strict=True):
+                results[index] = CatBulkResult(index=index, cat=CatRead.model_validate(cat))
+        return results
+
+    async def _insert_cats(self, payloads: list[CatCreate]) -> list[Cat]:
+        """Insert cats with a multi-row INSERT ... RETURNING, preserving payload order."""
+        rows = [
+            {
+                "id": uuid4(),
+                "name": item.name,
+                "years_experience": item.years_experience,
+                "breed": item.breed,
+                "salary": item.salary,
+            }
+            for item in payloads
+        ]
+        cats = list((await self.session.scalars(insert(Cat).returning(Cat, sort_by_parameter_order=True), rows)).all())
+        await self.stats.cats_added(cats)
+        return cats
+
+    async def list_cats(
+        self, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None, breed: str | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Return a keyset page of cats as column mappings ordered by id and the cursor for the next page."""
+        stmt = select(*CAT_COLUMNS).order_by(Cat.id).limit(limit + 1)
+        if cursor is not None:
+            (last_id,) = decode_cursor(cursor, UUID)
+            stmt = stmt.where(Cat.id > last_id)
+        if breed is not None:
+            stmt = stmt.where(func.lower(Cat.breed) == breed.lower())
+        result = await self.session.execute(stmt)
+        cats = [dict(row) for row in result.mappings()]
+        if len(cats) <= limit:
+            return cats, None
+        cats = cats[:limit]
+        return cats, encode_cursor(cats[-1]["id"])
+
+    async def export_cats(self) -> AsyncIterator[dict[str, Any]]:
+        """Stream every cat as a plain column mapping through a server-side cursor."""
+        stmt = select(*CAT_COLUMNS).order_by(Cat.id)
+        result = await self.session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for row in result.mappings():
+            yield dict(row)
+
+    async def get_cat(self, cat_id: UUID) -> dict[str, Any]:
+        """Return cat columns by id without ORM hydration or raise 404."""
+        row = (await self.session.execute(select(*CAT_COLUMNS).where(Cat.id == cat_id))).mappings().first()
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cat not found")
+        return dict(row)
 
-    async def get_cat(self, cat_id: UUID) -> Cat:
-        """Return cat by id or raise 404."""
+    async def _get_cat_entity(self, cat_id: UUID) -> Cat:
+        """Return tracked cat entity for write paths or raise 404."""
         cat = await self.session.get(Cat, cat_id)
         if not cat:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cat not found")
@@ -48,20 +122,29 @@ class CatService:
 
     async def update_salary(self, cat_id: UUID, payload: CatUpdateSalary) -> Cat:
         """Update salary for a cat."""
-        cat = await self.get_cat(cat_id)
+        cat = await self._get_cat_entity(cat_id)
+        await self.stats.salary_changed(cat.breed, payload.salary - cat.salary)
         cat.salary = payload.salary
         await self.session.commit()
+        response_cache.invalidate("cat", cat_id)
+        job_queue.submit(WARM_RESPONSE_CACHE, "cat", cat_id)
+        job_queue.submit(AUDIT_EVENT, "cat.salary_updated", cat_id, {"salary": format(payload.salary, ".2f")})
         await self.session.refresh(cat)
         return cat
 
     async def delete_cat(self, cat_id: UUID) -> None:
         """Delete cat if it is not assigned to an active mission."""
-        cat = await self.get_cat(cat_id)
-        active_mission = await self.session.execute(select(Mission).where(Mission.assigned_cat_id == cat_id, Mission.complete.is_(False)))
-        if active_mission.scalars().first():
+        cat = await self._get_cat_entity(cat_id)
+        missions = (await self.session.execute(select(Mission.id, Mission.complete).where(Mission.assigned_cat_id == cat_id))).all()
+        if any(not mission.complete for mission in missions):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Cat cannot be removed while assigned to an active mission",
             )
+        await self.stats.cat_removed(cat)
         await self.session.delete(cat)
         await self.session.commit()
+        response_cache.invalidate("cat", cat_id)
+        # Completed missions lose their assigned cat through ON DELETE SET NULL.
+        response_cache.invalidate("mission", *(mission.id for mission in missions))
+        job_queue.submit(AUDIT_EVENT, "cat.deleted", cat_id)
@@ -1,12 +1,37 @@
-from uuid import UUID
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any, NoReturn
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, select
+from sqlalchemy import case, exists, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from ..models import Cat, Mission, Target
-from ..schemas.missions import MissionAssign, MissionCreate, TargetUpdate
+from ..events import broker
+from ..jobs import AUDIT_EVENT, WARM_RESPONSE_CACHE, job_queue
+from ..models import ACTIVE_CAT_INDEX, Cat, Mission, Target
+from ..pagination import DEFAULT_PAGE_SIZE, EXPORT_BATCH_SIZE, decode_cursor, encode_cursor
+from ..response_cache import response_cache
+from ..schemas.missions import (
+    MissionAssign,
+    MissionBulkCreate,
+    MissionBulkResult,
+    MissionCreate,
+    MissionRead,
+    TargetBatchUpdate,
+    TargetRead,
+    TargetUpdate,
+)
+from ..search_index import target_search_index
+from .stats_service import StatsService
+
+CAT_BUSY_DETAIL = "Cat is busy with another active mission"
+MISSION_COLUMNS = (Mission.id, Mission.assigned_cat_id, Mission.complete, Mission.created_at)
+TARGET_COLUMNS = (Target.id, Target.name, Target.country, Target.notes, Target.complete)
 
 
 class MissionService:
@@ -14,26 +39,106 @@ class MissionService:
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self.stats = StatsService(session)
 
-    async def _get_mission(self, mission_id: UUID, with_targets: bool = False) -> Mission:
-        """Fetch mission by id with optional targets eager load."""
+    async def _get_mission(self, mission_id: UUID) -> Mission:
+        """Fetch tracked mission entity by id for write paths."""
         stmt = select(Mission).where(Mission.id == mission_id)
-        if with_targets:
-            stmt = stmt.options(selectinload(Mission.targets))
         result = await self.session.execute(stmt)
         mission = result.scalars().first()
         if not mission:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mission not found")
         return mission
 
-    async def list_missions(self) -> list[Mission]:
-        """Return all missions with targets."""
-        result = await self.session.execute(select(Mission).options(selectinload(Mission.targets)))
-        return list(result.scalars().all())
+    async def list_missions(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        complete: bool | None = None,
+        assigned_cat_id: UUID | None = None,
+        country: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Return a keyset page of missions with targets as plain mappings ordered by (created_at, id) and the next cursor."""
+        stmt = select(*MISSION_COLUMNS).order_by(Mission.created_at, Mission.id).limit(limit + 1)
+        if cursor is not None:
+            last_created_at, last_id = decode_cursor(cursor, datetime.fromisoformat, UUID)
+            stmt = stmt.where(tuple_(Mission.created_at, Mission.id) > tuple_(last_created_at, last_id))
+        if complete is not None:
+            stmt = stmt.where(Mission.complete.is_(complete))
+        if assigned_cat_id is not None:
+            stmt = stmt.where(Mission.assigned_cat_id == assigned_cat_id)
+        if country is not None:
+            stmt = stmt.where(Mission.targets.any(Target.country == country))
+        result = await self.session.execute(stmt)
+        missions = [dict(row) for row in result.mappings()]
+        next_cursor = None
+        if len(missions) > limit:
+            missions = missions[:limit]
+            next_cursor = encode_cursor(missions[-1]["created_at"].isoformat(), missions[-1]["id"])
+        return await self._attach_targets(missions), next_cursor
+
+    async def _attach_targets(self, missions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Load targets for mission mappings with one Core query and nest them under "targets"."""
+        by_id = {mission["id"]: mission for mission in missions}
+        for mission in missions:
+            mission["targets"] = []
+        if not by_id:
+            return missions
+        rows = await self.session.execute(select(Target.mission_id, *TARGET_COLUMNS).where(Target.mission_id.in_(list(by_id))))
+        for mission_id, target_id, name, country, notes, complete in rows:
+            by_id[mission_id]["targets"].append({"id": target_id, "name": name, "country": country, "notes": notes, "complete": complete})
+        return missions
+
+    async def export_missions(self) -> AsyncIterator[dict[str, Any]]:
+        """Stream every mission with its targets as plain mappings through a server-side cursor."""
+        stmt = (
+            select(
+                Mission.id,
+                Mission.assigned_cat_id,
+                Mission.complete,
+                Mission.created_at,
+                Target.id.label("target_id"),
+                Target.name.label("target_name"),
+                Target.country.label("target_country"),
+                Target.notes.label("target_notes"),
+                Target.complete.label("target_complete"),
+            )
+            .outerjoin(Target, Target.mission_id == Mission.id)
+            .order_by(Mission.created_at, Mission.id, Target.id)
+        )
+        result = await self.session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        current: dict[str, Any] | None = None
+        async for row in result:
+            if current is None or current["id"] != row.id:
+                if current is not None:
+                    yield current
+                current = {
+                    "id": row.id,
+                    "assigned_cat_id": row.assigned_cat_id,
+                    "complete": row.complete,
+                    "created_at": row.created_at,
+                    "targets": [],
+                }
+            if row.target_id is not None:
+                current["targets"].append(
+                    {
+                        "id": row.target_id,
+                        "name": row.target_name,
+                        "country": row.target_country,
+                        "notes": row.target_notes,
+                        "complete": row.target_complete,
+                    }
+                )
+        if current is not None:
+            yield current
 
-    async def get_mission(self, mission_id: UUID) -> Mission:
-        """Return mission with targets by id."""
-        return await self._get_mission(mission_id, with_targets=True)
+    async def get_mission(self, mission_id: UUID) -> dict[str, Any]:
+        """Return mission with targets by id as a plain mapping, without ORM hydration."""
+        row = (await self.session.execute(select(*MISSION_COLUMNS).where(Mission.id == mission_id))).mappings().first()
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mission not found")
+        (mission,) = await self._attach_targets([dict(row)])
+        return mission
 
     async def create_mission(self, payload: MissionCreate) -> Mission:
         """Create mission with 1–3 targets."""
@@ -43,27 +148,38 @@ class MissionService:
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Mission must include between 1 and 3 targets",
             )
-        mission = Mission()
-        self.session.add(mission)
-        await self.session.flush()
-        targets = [
-            Target(
-                mission_id=mission.id,
-                name=target.name,
-                country=target.country,
-                notes=target.notes,
-                complete=target.complete,
-            )
-            for target in targets_payload
-        ]
-        self.session.add_all(targets)
+        (mission,) = await self._insert_missions([payload])
         await self.session.commit()
-        await self.session.refresh(mission)
-        await self.session.refresh(mission, attribute_names=["targets"])
-        await self._update_mission_completion(mission)
-        await self.session.refresh(mission, attribute_names=["targets"])
+        _index_targets([mission])
+        job_queue.submit(AUDIT_EVENT, "mission.created", mission.id)
         return mission
 
+    async def bulk_create_missions(self, payload: MissionBulkCreate) -> list[MissionBulkResult]:
+        """Create many missions with their targets in one transaction."""
+        missions = await self._insert_missions(payload.items)
+        await self.session.commit()
+        _index_targets(missions)
+        job_queue.submit(AUDIT_EVENT, "mission.bulk_created", None, {"ids": [str(mission.id) for mission in missions]})
+        return [MissionBulkResult(index=index, mission=MissionRead.model_validate(mission)) for index, mission in enumerate(missions)]
+
+    async def _insert_missions(self, payloads: list[MissionCreate]) -> list[Mission]:
+        """Insert missions and their targets with two multi-row INSERT ... RETURNING statements."""
+        mission_rows: list[dict[str, Any]] = []
+        target_rows: list[dict[str, Any]] = []
+        for item in payloads:
+            mission_id = uuid4()
+            mission_rows.append({"id": mission_id, "complete": all(target.complete for target in item.targets)})
+            target_rows.extend({"id": uuid4(), "mission_id": mission_id, **target.model_dump()} for target in item.targets)
+        missions = (await self.session.scalars(insert(Mission).returning(Mission, sort_by_parameter_order=True), mission_rows)).all()
+        targets = (await self.session.scalars(insert(Target).returning(Target, sort_by_parameter_order=True), target_rows)).all()
+        targets_by_mission: dict[UUID, list[Target]] = defaultdict(list)
+        for target in targets:
+            targets_by_mission[target.mission_id].append(target)
+        for mission in missions:
+            set_committed_value(mission, "targets", targets_by_mission[mission.id])
+        await self.stats.missions_added(missions)
+        return list(missions)
+
     async def delete_mission(self, mission_id: UUID) -> None:
         """Delete mission if not assigned to a cat."""
         mission = await self._get_mission(mission_id)
@@ -72,12 +188,53 @@ class MissionService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Mission cannot be deleted while assigned to a cat",
             )
+        targets = (await self.session.execute(select(Target.country, Target.complete).where(Target.mission_id == mission_id))).tuples()
+        await self.stats.mission_removed(mission.complete, targets.all())
         await self.session.delete(mission)
         await self.session.commit()
+        response_cache.invalidate("mission", mission_id)
+        target_search_index.mission_removed(mission_id)
+        job_queue.submit(AUDIT_EVENT, "mission.deleted", mission_id)
 
     async def assign_cat(self, mission_id: UUID, payload: MissionAssign) -> Mission:
-        """Assign cat to mission ensuring cat is free and mission open."""
-        mission = await self._get_mission(mission_id, with_targets=True)
+        """Assign cat to mission ensuring cat is free and mission open, in a single conditional UPDATE."""
+        other = aliased(Mission)
+        cat_is_busy = exists().where(other.assigned_cat_id == payload.cat_id, other.complete.is_(False))
+        stmt = (
+            update(Mission)
+            .where(
+                Mission.id == mission_id,
+                Mission.complete.is_(False),
+                Mission.assigned_cat_id.is_(None),
+                exists().where(Cat.id == payload.cat_id),
+                ~cat_is_busy,
+            )
+            .values(assigned_cat_id=payload.cat_id)
+            .returning(Mission)
+            .options(selectinload(Mission.targets))
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            mission = (await self.session.scalars(stmt)).first()
+        except IntegrityError as exc:
+            # A concurrent assignment of the same cat committed first and won the unique index.
+            await self.session.rollback()
+            if not _is_active_cat_conflict(exc):
+                raise
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=CAT_BUSY_DETAIL) from exc
+        if mission is None:
+            await self._raise_assign_conflict(mission_id, payload.cat_id)
+        await self.stats.cat_assigned(payload.cat_id)
+        await self.session.commit()
+        response_cache.invalidate("mission", mission_id)
+        job_queue.submit(WARM_RESPONSE_CACHE, "mission", mission_id)
+        job_queue.submit(AUDIT_EVENT, "mission.assigned", mission_id, {"cat_id": str(payload.cat_id)})
+        broker.publish("mission.assigned", mission_id, payload.cat_id)
+        return mission
+
+    async def _raise_assign_conflict(self, mission_id: UUID, cat_id: UUID) -> NoReturn:
+        """Explain why a conditional assignment matched no rows."""
+        mission = await self._get_mission(mission_id)
         if mission.complete:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -88,49 +245,132 @@ class MissionService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Mission already has an assigned cat",
             )
-
-        cat = await self.session.get(Cat, payload.cat_id)
-        if not cat:
+        if await self.session.get(Cat, cat_id) is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cat not found")
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=CAT_BUSY_DETAIL)
 
-        busy_mission = await self.session.execute(
-            select(Mission).where(and_(Mission.assigned_cat_id == payload.cat_id, Mission.complete.is_(False)))
+    async def update_target(self, mission_id: UUID, target_id: UUID, payload: TargetUpdate) -> Target:
+        """Update target notes/complete flags while respecting completion guards."""
+        # Locking the open mission row serializes target updates per mission, so the completion
+        # check below always sees targets committed by concurrent requests.
+        mission_is_open = exists(select(Mission.id).where(Mission.id == mission_id, Mission.complete.is_(False)).with_for_update())
+        stmt = (
+            update(Target)
+            .where(Target.id == target_id, Target.mission_id == mission_id, Target.complete.is_(False), mission_is_open)
+            .values(
+                notes=Target.notes if payload.notes is None else payload.notes,
+                complete=Target.complete if payload.complete is None else payload.complete,
+            )
+            .returning(Target, select(Mission.assigned_cat_id).where(Mission.id == mission_id).scalar_subquery())
+            .execution_options(synchronize_session=False)
         )
-        if busy_mission.scalars().first():
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Cat is busy with another active mission")
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            await self._raise_target_conflict(mission_id, target_id)
+        target, cat_id = row
+        mission_completed = False
+        if target.complete:
+            await self.stats.targets_completed([target.country])
+            mission_completed = await self._update_mission_completion(mission_id)
+        await self.session.commit()
+        self._targets_updated(mission_id, cat_id, [target], mission_completed)
+        return target
 
-        mission.assigned_cat_id = payload.cat_id
+    async def update_targets(self, mission_id: UUID, payload: TargetBatchUpdate) -> list[Target]:
+        """Apply several target updates with one UPDATE and a single mission completion check, all or nothing."""
+        target_ids = [item.id for item in payload.items]
+        notes = {item.id: item.notes for item in payload.items if item.notes is not None}
+        completes = {item.id: item.complete for item in payload.items if item.complete is not None}
+        mission_is_open = exists(select(Mission.id).where(Mission.id == mission_id, Mission.complete.is_(False)).with_for_update())
+        stmt = (
+            update(Target)
+            .where(Target.id.in_(target_ids), Target.mission_id == mission_id, Target.complete.is_(False), mission_is_open)
+            .values(
+                notes=case(notes, value=Target.id, else_=Target.notes) if notes else Target.notes,
+                complete=case(completes, value=Target.id, else_=Target.complete) if completes else Target.complete,
+            )
+            .returning(Target, select(Mission.assigned_cat_id).where(Mission.id == mission_id).scalar_subquery())
+            .execution_options(synchronize_session=False)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        updated = {target.id: target for target, _ in rows}
+        missing = next((target_id for target_id in target_ids if target_id not in updated), None)
+        if missing is not None:
+            # Nothing is committed: the session rolls back the rows that did match.
+            await self._raise_target_conflict(mission_id, missing)
+        targets = [updated[target_id] for target_id in target_ids]
+        cat_id = rows[0][1]
+        mission_completed = False
+        completed_countries = [target.country for target in targets if target.complete]
+        if completed_countries:
+            await self.stats.targets_completed(completed_countries)
+            mission_completed = await self._update_mission_completion(mission_id)
         await self.session.commit()
-        await self.session.refresh(mission)
-        await self.session.refresh(mission, attribute_names=["targets"])
-        return mission
+        self._targets_updated(mission_id, cat_id, targets, mission_completed)
+        return targets
 
-    async def update_target(self, mission_id: UUID, target_id: UUID, payload: TargetUpdate) -> Target:
-        """Update target notes/complete flags while respecting completion guards."""
-        mission = await self._get_mission(mission_id, with_targets=True)
-        target = next((t for t in mission.targets if t.id == target_id), None)
-        if not target:
+    def _targets_updated(self, mission_id: UUID, cat_id: UUID | None, targets: list[Target], mission_completed: bool) -> None:
+        """Run the post-commit side effects of target updates: caches, search index, audit and change feed."""
+        response_cache.invalidate("mission", mission_id)
+        for target in targets:
+            target_search_index.upsert(target, mission_completed)
+        if mission_completed:
+            target_search_index.mission_completed(mission_id)
+        job_queue.submit(WARM_RESPONSE_CACHE, "mission", mission_id)
+        for target in targets:
+            job_queue.submit(AUDIT_EVENT, "target.updated", target.id, {"mission_id": str(mission_id), "complete": target.complete})
+            broker.publish("target.updated", mission_id, cat_id, target=TargetRead.model_validate(target).model_dump(mode="json"))
+        if mission_completed:
+            job_queue.submit(AUDIT_EVENT, "mission.completed", mission_id)
+            broker.publish("mission.completed", mission_id, cat_id)
+
+    async def _raise_target_conflict(self, mission_id: UUID, target_id: UUID) -> NoReturn:
+        """Explain why a conditional target update matched no rows."""
+        await self._get_mission(mission_id)
+        target = await self.session.get(Target, target_id)
+        if target is None or target.mission_id != mission_id:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Target not found")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Cannot update target because it or its mission is completed",
+        )
 
-        if mission.complete or target.complete:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Cannot update target because it or its mission is completed",
-            )
+    async def _update_mission_completion(self, mission_id: UUID) -> bool:
+        """Mark mission complete when all targets are complete; return True if it was completed now."""
+        stmt = (
+            update(Mission)
+            .where(Mission.id == mission_id, Mission.complete.is_(False), ~Mission.targets.any(Target.complete.is_(False)))
+            .values(complete=True)
+            .returning(Mission.assigned_cat_id)
+            .execution_options(synchronize_session=False)
+        )
+        completed = (await self.session.execute(stmt)).first()
+        if completed is None:
+            return False
+        await self.stats.mission_completed(completed.assigned_cat_id)
+        return True
 
-        if payload.notes is not None:
-            target.notes = payload.notes
-        if payload.complete is not None:
-            target.complete = payload.complete
 
-        await self.session.commit()
-        await self._update_mission_completion(mission)
-        await self.session.refresh(target)
-        return target
+def _index_targets(missions: list[Mission]) -> None:
+    """Add committed targets to the in-process search index (a no-op until the index is first built)."""
+    for mission in missions:
+        for target in mission.targets:
+            target_search_index.upsert(target, mission.complete)
+
+
+def _violated_constraint(exc: IntegrityError) -> str | None:
+    """Constraint name reported by drivers that expose it (asyncpg on the cause, psycopg on .diag)."""
+    for error in (exc.orig, exc.orig.__cause__):
+        name = getattr(error, "constraint_name", None) or getattr(getattr(error, "diag", None), "constraint_name", None)
+        if name:
+            return name
+    return None
+
 
-    async def _update_mission_completion(self, mission: Mission) -> None:
-        """Mark mission complete when all targets are complete."""
-        if all(target.complete for target in mission.targets):
-            mission.complete = True
-            await self.session.commit()
-            await self.session.refresh(mission)
+def _is_active_cat_conflict(exc: IntegrityError) -> bool:
+    """True when the violation comes from the one-active-mission-per-cat index."""
+    constraint = _violated_constraint(exc)
+    if constraint is not None:
+        return constraint == ACTIVE_CAT_INDEX
+    # SQLite names only the columns: "UNIQUE constraint failed: missions.assigned_cat_id".
+    return ACTIVE_CAT_INDEX in str(exc.orig) or "missions.assigned_cat_id" in str(exc.orig)
@@ -0,0 +1,74 @@
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, func, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Mission, Target
+from ..pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from ..search_index import target_search_index
+
+SEARCH_CONFIG = "english"
+# Generated tsvector column with a GIN index, created by migration 0006 on PostgreSQL only.
+SEARCH_VECTOR = literal_column("targets.search_vector")
+
+
+class TargetSearchService:
+    """Ranked full-text search over target name, country and notes."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def search(
+        self, query: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None, mission_complete: bool | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Return a page of matching targets ordered by (rank desc, id) and the cursor for the next page."""
+        after = tuple(decode_cursor(cursor, float, UUID)) if cursor is not None else None
+        if self.session.bind.dialect.name == "postgresql":
+            hits = await self._search_postgres(query, limit + 1, after, mission_complete)
+        else:
+            await target_search_index.ensure_built(self.session)
+            hits = [
+                {
+                    "id": doc.id,
+                    "mission_id": doc.mission_id,
+                    "name": doc.name,
+                    "country": doc.country,
+                    "notes": doc.notes,
+                    "complete": doc.complete,
+                    "mission_complete": doc.mission_complete,
+                    "rank": rank,
+                }
+                for doc, rank in target_search_index.search(query, limit + 1, after, mission_complete)
+            ]
+        if len(hits) <= limit:
+            return hits, None
+        hits = hits[:limit]
+        return hits, encode_cursor(hits[-1]["rank"], hits[-1]["id"])
+
+    async def _search_postgres(
+        self, query: str, limit: int, after: tuple[float, UUID] | None, mission_complete: bool | None
+    ) -> list[dict[str, Any]]:
+        tsquery = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query)
+        rank = func.ts_rank(SEARCH_VECTOR, tsquery)
+        stmt = (
+            select(
+                Target.id,
+                Target.mission_id,
+                Target.name,
+                Target.country,
+                Target.notes,
+                Target.complete,
+                Mission.complete.label("mission_complete"),
+                rank.label("rank"),
+            )
+            .join(Mission, Mission.id == Target.mission_id)
+            .where(SEARCH_VECTOR.op("@@")(tsquery))
+            .order_by(rank.desc(), Target.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(or_(rank < after[0], and_(rank == after[0], Target.id > after[1])))
+        if mission_complete is not None:
+            stmt = stmt.where(Mission.complete.is_(mission_complete))
+        return [dict(row) for row in (await self.session.execute(stmt)).mappings()]
@@ -0,0 +1,199 @@
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import BreedStats, Cat, CatStats, CountryStats, Mission, StatCounter, Target
+
+MISSIONS_ACTIVE = "missions_active"
+MISSIONS_COMPLETED = "missions_completed"
+CATS_BUSY = "cats_busy"
+DEFAULT_TOP_CATS = 10
+
+
+def _rate(part: int, total: int) -> float:
+    return round(part / total, 4) if total else 0.0
+
+
+class StatsService:
+    """Dashboard aggregates read from summary tables that the cat and mission write paths keep current."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def _increment(self, model: Any, key: str, rows: list[dict[str, Any]]) -> None:
+        """Add the given deltas to summary rows, creating missing rows, in one INSERT ... ON CONFLICT."""
+        rows = sorted((row for row in rows if any(value for name, value in row.items() if name != key)), key=lambda row: str(row[key]))
+        if not rows:
+            return
+        dialect_insert = postgresql.insert if self.session.bind.dialect.name == "postgresql" else sqlite.insert
+        stmt = dialect_insert(model).values(rows)
+        deltas = {name: getattr(model, name) + stmt.excluded[name] for name in rows[0] if name != key}
+        await self.session.execute(stmt.on_conflict_do_update(index_elements=[key], set_=deltas))
+
+    async def _bump_counters(self, **deltas: int) -> None:
+        await self._increment(StatCounter, "name", [{"name": name, "value": value} for name, value in deltas.items()])
+
+    async def cats_added(self, cats: Iterable[Cat]) -> None:
+        by_breed: dict[str, list[Decimal]] = defaultdict(list)
+        for cat in cats:
+            by_breed[cat.breed].append(cat.salary)
+        rows = [{"breed": breed, "cats": len(salaries), "salary_total": sum(salaries)} for breed, salaries in by_breed.items()]
+        await self._increment(BreedStats, "breed", rows)
+
+    async def salary_changed(self, breed: str, delta: Decimal) -> None:
+        await self._increment(BreedStats, "breed", [{"breed": breed, "cats": 0, "salary_total": delta}])
+
+    async def cat_removed(self, cat: Cat) -> None:
+        await self._increment(BreedStats, "breed", [{"breed": cat.breed, "cats": -1, "salary_total": -cat.salary}])
+        # ON DELETE CASCADE covers PostgreSQL; SQLite does not enforce foreign keys by default.
+        await self.session.execute(delete(CatStats).where(CatStats.cat_id == cat.id))
+
+    async def missions_added(self, missions: Iterable[Mission]) -> None:
+        statuses: Counter[bool] = Counter()
+        countries: dict[str, Counter[str]] = defaultdict(Counter)
+        for mission in missions:
+            statuses[mission.complete] += 1
+            for target in mission.targets:
+                countries[target.country]["targets"] += 1
+                countries[target.country]["targets_completed"] += int(target.complete)
+        await self._bump_counters(**{MISSIONS_ACTIVE: statuses[False], MISSIONS_COMPLETED: statuses[True]})
+        await self._count_targets(countries)
+
+    async def mission_removed(self, complete: bool, targets: Iterable[tuple[str, bool]]) -> None:
+        """Subtract a deleted, unassigned mission given as its status and (country, complete) targets."""
+        countries: dict[str, Counter[str]] = defaultdict(Counter)
+        for country, target_complete in targets:
+            countries[country]["targets"] -= 1
+            countries[country]["targets_completed"] -= int(target_complete)
+        await self._bump_counters(**{MISSIONS_COMPLETED if complete else MISSIONS_ACTIVE: -1})
+        await self._count_targets(countries)
+
+    async def _count_targets(self, countries: dict[str, Counter[str]]) -> None:
+        rows = [
+            {"country": country, "targets": counts["targets"], "targets_completed": counts["targets_completed"]}
+            for country, counts in countries.items()
+        ]
+        await self._increment(CountryStats, "country", rows)
+
+    async def cat_assigned(self, cat_id: UUID) -> None:
+        await self._increment(CatStats, "cat_id", [{"cat_id": cat_id, "missions_assigned": 1, "missions_completed": 0}])
+        await self._bump_counters(**{CATS_BUSY: 1})
+
+    async def targets_completed(self, countries: Iterable[str]) -> None:
+        rows = [{"country": country, "targets": 0, "targets_completed": count} for country, count in Counter(countries).items()]
+        await self._increment(CountryStats, "country", rows)
+
+    async def mission_completed(self, cat_id: UUID | None) -> None:
+        await self._bump_counters(**{MISSIONS_ACTIVE: -1, MISSIONS_COMPLETED: 1, CATS_BUSY: -1 if cat_id is not None else 0})
+        if cat_id is not None:
+            await self._increment(CatStats, "cat_id", [{"cat_id": cat_id, "missions_assigned": 0, "missions_completed": 1}])
+
+    async def rebuild(self) -> None:
+        """Recompute every summary table from the base tables, e.g. after loading data outside the API."""
+        for model in (StatCounter, BreedStats, CountryStats, CatStats):
+            await self.session.execute(delete(model))
+        completed = func.coalesce(func.sum(case((Mission.complete, 1), else_=0)), 0)
+        await self.session.execute(
+            insert(BreedStats).from_select(
+                ["breed", "cats", "salary_total"], select(Cat.breed, func.count(), func.sum(Cat.salary)).group_by(Cat.breed)
+            )
+        )
+        await self.session.execute(
+            insert(CountryStats).from_select(
+                ["country", "targets", "targets_completed"],
+                select(Target.country, func.count(), func.sum(case((Target.complete, 1), else_=0)))
+                .join(Mission, Mission.id == Target.mission_id)
+                .group_by(Target.country),
+            )
+        )
+        await self.session.execute(
+            insert(CatStats).from_select(
+                ["cat_id", "missions_assigned", "missions_completed"],
+                select(Mission.assigned_cat_id, func.count(), completed)
+                .where(Mission.assigned_cat_id.is_not(None), Mission.assigned_cat_id.in_(select(Cat.id)))
+                .group_by(Mission.assigned_cat_id),
+            )
+        )
+        active = (await self.session.execute(select(completed, func.count()).select_from(Mission))).one()
+        busy = await self.session.scalar(
+            select(func.count(func.distinct(Mission.assigned_cat_id))).where(
+                Mission.complete.is_(False), Mission.assigned_cat_id.is_not(None)
+            )
+        )
+        await self._bump_counters(**{MISSIONS_ACTIVE: active[1] - active[0], MISSIONS_COMPLETED: active[0], CATS_BUSY: busy or 0})
+
+    async def _counters(self) -> dict[str, int]:
+        return dict((await self.session.execute(select(StatCounter.name, StatCounter.value))).tuples().all())
+
+    async def payroll(self) -> dict[str, Any]:
+        rows = (await self.session.execute(select(BreedStats).where(BreedStats.cats > 0).order_by(BreedStats.breed))).scalars().all()
+        cats = sum(row.cats for row in rows)
+        total = sum((row.salary_total for row in rows), Decimal("0"))
+        return {
+            "cats": cats,
+            "salary_total": total,
+            "salary_avg": round(total / cats, 2) if cats else Decimal("0"),
+            "by_breed": [
+                {
+                    "breed": row.breed,
+                    "cats": row.cats,
+                    "salary_total": row.salary_total,
+                    "salary_avg": round(row.salary_total / row.cats, 2),
+                }
+                for row in rows
+            ],
+        }
+
+    async def missions(self) -> dict[str, Any]:
+        counters = await self._counters()
+        active, completed = counters.get(MISSIONS_ACTIVE, 0), counters.get(MISSIONS_COMPLETED, 0)
+        return {
+            "active": active,
+            "completed": completed,
+            "total": active + completed,
+            "completion_rate": _rate(completed, active + completed),
+        }
+
+    async def cats(self, limit: int = DEFAULT_TOP_CATS) -> dict[str, Any]:
+        cats = await self.session.scalar(select(func.coalesce(func.sum(BreedStats.cats), 0))) or 0
+        busy = (await self._counters()).get(CATS_BUSY, 0)
+        top = (
+            await self.session.execute(
+                select(CatStats)
+                .where(CatStats.missions_assigned > 0)
+                .order_by(CatStats.missions_assigned.desc(), CatStats.cat_id.desc())
+                .limit(limit)
+            )
+        ).scalars()
+        return {
+            "cats": cats,
+            "busy": busy,
+            "utilization": _rate(busy, cats),
+            "top": [
+                {
+                    "cat_id": row.cat_id,
+                    "missions_assigned": row.missions_assigned,
+                    "missions_completed": row.missions_completed,
+                    "active": row.missions_assigned > row.missions_completed,
+                }
+                for row in top
+            ],
+        }
+
+    async def targets(self) -> dict[str, Any]:
+        rows = (
+            (await self.session.execute(select(CountryStats).where(CountryStats.targets > 0).order_by(CountryStats.country)))
+            .scalars()
+            .all()
+        )
+        return {
+            "targets": sum(row.targets for row in rows),
+            "targets_completed": sum(row.targets_completed for row in rows),
+            "by_country": rows,
+        }
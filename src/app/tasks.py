@@ -0,0 +1,45 @@
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+
+from .api.encoding import encode_json
+from .clients.cat_api import get_breeds
+from .db import new_session
+from .jobs import AUDIT_EVENT, WARM_BREEDS, WARM_RESPONSE_CACHE, job_queue
+from .models import AuditEvent
+from .response_cache import response_cache
+from .schemas.cats import CatRead
+from .schemas.missions import MissionRead
+from .services.cat_service import CatService
+from .services.mission_service import MissionService
+
+
+@job_queue.handler(AUDIT_EVENT)
+async def record_audit_event(action: str, entity_id: UUID | None, details: dict[str, Any] | None = None) -> None:
+    """Persist an audit record for a committed write."""
+    async with new_session() as session:
+        session.add(AuditEvent(action=action, entity_id=entity_id, details=details))
+        await session.commit()
+
+
+@job_queue.handler(WARM_RESPONSE_CACHE)
+async def warm_response_cache(kind: str, key: UUID) -> None:
+    """Re-render an entity invalidated by a write so the next GET is a cache hit."""
+    generation = response_cache.generation()
+    # Read from the primary: a lagging replica could put the pre-write body back into the cache.
+    async with new_session() as session:
+        try:
+            if kind == "mission":
+                body = encode_json(await MissionService(session).get_mission(key), MissionRead)
+            else:
+                body = encode_json(await CatService(session).get_cat(key), CatRead)
+        except HTTPException:
+            return
+    response_cache.put(kind, key, body, generation)
+
+
+@job_queue.handler(WARM_BREEDS)
+async def warm_breeds() -> None:
+    """Fetch the breed list ahead of the first create_cat when no shared snapshot exists yet."""
+    await get_breeds()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from benchmarks.catapi_stub import STUB_BASE_URL, install_catapi_stub
+from benchmarks.database import prepare_database
+
+# Settings are read when app modules are imported, so configure the environment first.
+# Point TEST_DATABASE_URL at a scratch PostgreSQL database to run the suite there; it is wiped.
+DATABASE_URL = os.environ.get("TEST_DATABASE_URL") or f"sqlite+aiosqlite:///{Path(tempfile.mkdtemp(prefix='spy-cat-tests-')) / 'test.sqlite3'}"
+os.environ.update(
+    {
+        "DATABASE_URL": DATABASE_URL,
+        "DATABASE_READ_URLS": "",
+        "CAT_API_BASE_URL": STUB_BASE_URL,
+        "BREED_CACHE_BACKEND": "memory",
+        "IDEMPOTENCY_BACKEND": "memory",
+        "RATE_LIMIT_PER_SECOND": "0",
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def database() -> str:
+    """Migrate a fresh database once per test session."""
+    prepare_database(DATABASE_URL, reset=True)
+    return DATABASE_URL
+
+
+@pytest.fixture
+async def app(database: str) -> AsyncIterator:
+    """A new app instance over empty tables, with TheCatAPI stubbed, running its lifespan."""
+    from app.db import Base, get_engine
+    from app.main import create_app
+    from app.response_cache import response_cache
+
+    async with get_engine().begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+    response_cache.clear()
+    application = create_app()
+    install_catapi_stub()
+    async with application.router.lifespan_context(application):
+        yield application
+
+
+@pytest.fixture
+async def client(app) -> AsyncIterator[httpx.AsyncClient]:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        yield http
@@ -0,0 +1,19 @@
+from typing import Any
+
+import httpx
+
+from benchmarks.catapi_stub import BREEDS
+
+
+async def create_cat(client: httpx.AsyncClient, name: str = "Agent", salary: str = "1000.00", **fields: Any) -> dict[str, Any]:
+    payload = {"name": name, "years_experience": 3, "breed": BREEDS[0], "salary": salary, **fields}
+    response = await client.post("/cats", json=payload)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def create_mission(client: httpx.AsyncClient, *targets: dict[str, Any]) -> dict[str, Any]:
+    targets = targets or ({"name": "Target", "country": "France"},)
+    response = await client.post("/missions", json={"targets": list(targets)})
+    assert response.status_code == 201, response.text
+    return response.json()
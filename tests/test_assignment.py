@@ -0,0 +1,60 @@
+import asyncio
+import os
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app.db import get_engine
+from app.models import Cat, Mission
+from app.services.mission_service import _is_active_cat_conflict
+from tests.helpers import create_cat, create_mission
+
+pytestmark = pytest.mark.anyio
+
+ASSIGNMENTS_PER_CAT = int(os.environ.get("STRESS_ASSIGNMENTS_PER_CAT", "10"))
+CATS = 3
+
+
+async def test_parallel_assignments_keep_one_active_mission_per_cat(client):
+    cats = [(await create_cat(client, name=f"Agent {index}"))["id"] for index in range(CATS)]
+    missions = [(await create_mission(client))["id"] for _ in range(CATS * ASSIGNMENTS_PER_CAT)]
+
+    async def assign(mission_id: str, cat_id: str) -> int:
+        return (await client.post(f"/missions/{mission_id}/assign", json={"cat_id": cat_id})).status_code
+
+    statuses = await asyncio.gather(*(assign(mission_id, cats[index % CATS]) for index, mission_id in enumerate(missions)))
+
+    assert statuses.count(200) == CATS
+    assert statuses.count(409) == len(missions) - CATS
+    async with get_engine().connect() as conn:
+        per_cat = (
+            await conn.execute(
+                select(Mission.assigned_cat_id, func.count())
+                .where(Mission.complete.is_(False), Mission.assigned_cat_id.is_not(None))
+                .group_by(Mission.assigned_cat_id)
+            )
+        ).all()
+    assert sorted(count for _, count in per_cat) == [1] * CATS
+
+
+async def test_active_cat_index_violation_is_recognized(database):
+    cat_id = uuid4()
+    async with get_engine().connect() as conn:
+        await conn.execute(insert(Cat).values(id=cat_id, name="Agent", years_experience=1, breed="Bengal", salary=100))
+        await conn.execute(insert(Mission).values(id=uuid4(), assigned_cat_id=cat_id, complete=False))
+        with pytest.raises(IntegrityError) as violation:
+            await conn.execute(insert(Mission).values(id=uuid4(), assigned_cat_id=cat_id, complete=False))
+        await conn.rollback()
+    assert _is_active_cat_conflict(violation.value)
+
+
+async def test_other_integrity_errors_are_not_treated_as_busy_cat(database):
+    cat_id = uuid4()
+    async with get_engine().connect() as conn:
+        await conn.execute(insert(Cat).values(id=cat_id, name="Agent", years_experience=1, breed="Bengal", salary=100))
+        with pytest.raises(IntegrityError) as violation:
+            await conn.execute(insert(Cat).values(id=cat_id, name="Agent", years_experience=1, breed="Bengal", salary=100))
+        await conn.rollback()
+    assert not _is_active_cat_conflict(violation.value)